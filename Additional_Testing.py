@@ -3,8 +3,6 @@
 # (either "incomplete" or "complete"). The TaskManager provides methods to add, remove, list tasks, and
 # update their status.
 
-import json
-import os
 from datetime import datetime
 
 class Task:
@@ -14,7 +12,14 @@ class Task:
         title (str): The title of the task.
         description (str): A brief description of the task.
         status (str): The status of the task, either "incomplete" or "complete".
+        status_code (int): The status encoded as Task.INCOMPLETE or Task.COMPLETE.
     """
+    __slots__ = ("title", "description", "status_code")
+
+    INCOMPLETE = 0
+    COMPLETE = 1
+    _STATUS_NAMES = ("incomplete", "complete")
+
     def __init__(self, title: str, description: str, status: str = "incomplete"):
         """
         Initializes a new Task instance.
@@ -27,17 +32,33 @@ class Task:
         self.description = description
         self.status = status
 
+    @property
+    def status(self):
+        """
+        Returns the status of the task as a string, either "incomplete" or "complete".
+        """
+        return Task._STATUS_NAMES[self.status_code]
+
+    @status.setter
+    def status(self, status: str):
+        """
+        Sets the status of the task from its string form.
+        Args:
+            status (str): The new status, either "incomplete" or "complete".
+        """
+        self.status_code = Task.COMPLETE if status == "complete" else Task.INCOMPLETE
+
     def mark_complete(self):
         """
         Marks the task as complete by setting its status to "complete".
         """
-        self.status = "complete"
+        self.status_code = Task.COMPLETE
 
     def mark_incomplete(self):
         """
         Marks the task as incomplete by setting its status to "incomplete".
         """
-        self.status = "incomplete"
+        self.status_code = Task.INCOMPLETE
 
 class TaskManager:
     """
@@ -50,6 +71,15 @@ class TaskManager:
         Initializes a new TaskManager instance with an empty task list.
         """
         self.tasks = []
+        self._by_title = {}  # Maps each title to the tasks carrying it, in insertion order
+
+    def _index_task(self, task: Task):
+        """
+        Registers a task in the title index so lookups by title avoid scanning the task list.
+        Args:
+            task (Task): The task to register.
+        """
+        self._by_title.setdefault(task.title, []).append(task)
 
     def add_task(self, title: str, description: str):
         """
@@ -60,6 +90,18 @@ class TaskManager:
         """
         task = Task(title, description)
         self.tasks.append(task)
+        self._index_task(task)
+
+    def add_tasks(self, rows):
+        """
+        Adds several tasks to the task list in one call.
+        Args:
+            rows (iterable): Dictionaries of Task arguments, each with at least a "title" and a "description".
+        """
+        new_tasks = [Task(**row) for row in rows]
+        self.tasks.extend(new_tasks)
+        for task in new_tasks:
+            self._index_task(task)
 
     def remove_task(self, title: str):
         """
@@ -67,14 +109,26 @@ class TaskManager:
         Args:
             title (str): The title of the task to be removed.
         """
-        self.tasks = [task for task in self.tasks if task.title != title]
+        removed = self._by_title.pop(title, None)
+        if removed is None:
+            return
+        if len(removed) == 1:
+            self.tasks.remove(removed[0])
+            return
+        # Several tasks share the title: compact the survivors in place, keeping their order
+        kept = 0
+        for task in self.tasks:
+            if task.title != title:
+                self.tasks[kept] = task
+                kept += 1
+        del self.tasks[kept:]
 
     def list_tasks(self):
         """
         Lists all tasks in the task list, displaying their title, description, and status.
         """
-        for task in self.tasks:
-            print(f"Title: {task.title}, Description: {task.description}, Status: {task.status}")
+        if self.tasks:
+            print("\n".join([f"Title: {task.title}, Description: {task.description}, Status: {task.status}" for task in self.tasks]))
 
     def mark_task_complete(self, title: str):
         """
@@ -82,9 +136,8 @@ class TaskManager:
         Args:
             title (str): The title of the task to be marked as complete.
         """
-        for task in self.tasks:
-            if task.title == title:
-                task.mark_complete()
+        for task in self._by_title.get(title, ()):
+            task.mark_complete()
 
     def mark_task_incomplete(self, title: str):
         """
@@ -92,9 +145,8 @@ class TaskManager:
         Args:
             title (str): The title of the task to be marked as incomplete.
         """
-        for task in self.tasks:
-            if task.title == title:
-                task.mark_incomplete()
+        for task in self._by_title.get(title, ()):
+            task.mark_incomplete()
 
 
 
@@ -103,7 +155,7 @@ class TaskManager:
 import unittest
 from unittest.mock import MagicMock
 from datetime import datetime, timedelta
-from Task import Task, TaskManager, TaskWithDueDateAndPriority, TaskManagerWithDueDatesAndSorting
+from Task import Task, TaskManager, Priority, TaskWithDueDateAndPriority, TaskManagerWithDueDatesAndSorting
 
 class TestTask(unittest.TestCase):
     """
@@ -147,8 +199,10 @@ class TestTaskManager(unittest.TestCase):
         self.manager.add_task("Task 2", "Description 2")
         with unittest.mock.patch('builtins.print') as mocked_print:
             self.manager.list_tasks()
-            mocked_print.assert_any_call("Title: Task 1, Description: Description 1, Status: incomplete")
-            mocked_print.assert_any_call("Title: Task 2, Description: Description 2, Status: incomplete")
+            mocked_print.assert_called_once_with(
+                "Title: Task 1, Description: Description 1, Status: incomplete\n"
+                "Title: Task 2, Description: Description 2, Status: incomplete"
+            )
 
 class TestTaskWithDueDateAndPriority(unittest.TestCase):
     """
@@ -157,7 +211,8 @@ class TestTaskWithDueDateAndPriority(unittest.TestCase):
     def test_due_date_initialization(self):
         task = TaskWithDueDateAndPriority("Task 1", "Description 1", due_date="2023-10-15", priority="high")
         self.assertEqual(task.due_date, datetime.strptime("2023-10-15", "%Y-%m-%d"))
-        self.assertEqual(task.priority, "high")
+        self.assertEqual(task.priority, Priority.HIGH)
+        self.assertEqual(str(task.priority), "high")
 
     def test_is_due_soon(self):
         task = TaskWithDueDateAndPriority("Task 1", "Description 1", due_date=(datetime.now() + timedelta(days=2)).strftime("%Y-%m-%d"))
@@ -186,9 +241,10 @@ class TestPerformance(unittest.TestCase):
         Tests the system's ability to handle a large number of tasks.
         """
         manager = TaskManager()
-        for i in range(10000):
-            manager.add_task(f"Task {i}", f"Description {i}")
+        manager.add_tasks({"title": f"Task {i}", "description": f"Description {i}"} for i in range(10000))
         self.assertEqual(len(manager.tasks), 10000)
+        manager.mark_task_complete("Task 9999")
+        self.assertEqual(manager.tasks[-1].status, "complete")
 
     def test_sorting_performance(self):
         """
@@ -3,9 +3,20 @@
 # (either "incomplete" or "complete"). The TaskManager provides methods to add, remove, list tasks, and
 # update their status.
 
-import json
-import os
+import sys
 from datetime import datetime
+from itertools import count
+
+def _intern(value):
+    """
+    Interns a category or tag so that equal values share one string object and compare on identity.
+    Args:
+        value (str): The category or tag to intern.
+    Returns:
+        str: The interned value, or the value unchanged if it is not exactly a str
+            (sys.intern rejects str subclasses and other types).
+    """
+    return sys.intern(value) if type(value) is str else value
 
 class Task:
     """
@@ -14,7 +25,14 @@ class Task:
         title (str): The title of the task.
         description (str): A brief description of the task.
         status (str): The status of the task, either "incomplete" or "complete".
+        status_code (int): The status encoded as Task.INCOMPLETE or Task.COMPLETE.
     """
+    __slots__ = ("title", "description", "status_code")
+
+    INCOMPLETE = 0
+    COMPLETE = 1
+    _STATUS_NAMES = ("incomplete", "complete")
+
     def __init__(self, title: str, description: str, status: str = "incomplete"):
         """
         Initializes a new Task instance.
@@ -27,17 +45,33 @@ class Task:
         self.description = description
         self.status = status
 
+    @property
+    def status(self):
+        """
+        Returns the status of the task as a string, either "incomplete" or "complete".
+        """
+        return Task._STATUS_NAMES[self.status_code]
+
+    @status.setter
+    def status(self, status: str):
+        """
+        Sets the status of the task from its string form.
+        Args:
+            status (str): The new status, either "incomplete" or "complete".
+        """
+        self.status_code = Task.COMPLETE if status == "complete" else Task.INCOMPLETE
+
     def mark_complete(self):
         """
         Marks the task as complete by setting its status to "complete".
         """
-        self.status = "complete"
+        self.status_code = Task.COMPLETE
 
     def mark_incomplete(self):
         """
         Marks the task as incomplete by setting its status to "incomplete".
         """
-        self.status = "incomplete"
+        self.status_code = Task.INCOMPLETE
 
 class TaskManager:
     """
@@ -50,6 +84,15 @@ class TaskManager:
         Initializes a new TaskManager instance with an empty task list.
         """
         self.tasks = []
+        self._by_title = {}  # Maps each title to the tasks carrying it, in insertion order
+
+    def _index_task(self, task: Task):
+        """
+        Registers a task in the title index so lookups by title avoid scanning the task list.
+        Args:
+            task (Task): The task to register.
+        """
+        self._by_title.setdefault(task.title, []).append(task)
 
     def add_task(self, title: str, description: str):
         """
@@ -60,6 +103,18 @@ class TaskManager:
         """
         task = Task(title, description)
         self.tasks.append(task)
+        self._index_task(task)
+
+    def add_tasks(self, rows):
+        """
+        Adds several tasks to the task list in one call.
+        Args:
+            rows (iterable): Dictionaries of Task arguments, each with at least a "title" and a "description".
+        """
+        new_tasks = [Task(**row) for row in rows]
+        self.tasks.extend(new_tasks)
+        for task in new_tasks:
+            self._index_task(task)
 
     def remove_task(self, title: str):
         """
@@ -67,14 +122,26 @@ class TaskManager:
         Args:
             title (str): The title of the task to be removed.
         """
-        self.tasks = [task for task in self.tasks if task.title != title]
+        removed = self._by_title.pop(title, None)
+        if removed is None:
+            return
+        if len(removed) == 1:
+            self.tasks.remove(removed[0])
+            return
+        # Several tasks share the title: compact the survivors in place, keeping their order
+        kept = 0
+        for task in self.tasks:
+            if task.title != title:
+                self.tasks[kept] = task
+                kept += 1
+        del self.tasks[kept:]
 
     def list_tasks(self):
         """
         Lists all tasks in the task list, displaying their title, description, and status.
         """
-        for task in self.tasks:
-            print(f"Title: {task.title}, Description: {task.description}, Status: {task.status}")
+        if self.tasks:
+            print("\n".join([f"Title: {task.title}, Description: {task.description}, Status: {task.status}" for task in self.tasks]))
 
     def mark_task_complete(self, title: str):
         """
@@ -82,9 +149,8 @@ class TaskManager:
         Args:
             title (str): The title of the task to be marked as complete.
         """
-        for task in self.tasks:
-            if task.title == title:
-                task.mark_complete()
+        for task in self._by_title.get(title, ()):
+            task.mark_complete()
 
     def mark_task_incomplete(self, title: str):
         """
@@ -92,17 +158,18 @@ class TaskManager:
         Args:
             title (str): The title of the task to be marked as incomplete.
         """
-        for task in self.tasks:
-            if task.title == title:
-                task.mark_incomplete()
+        for task in self._by_title.get(title, ()):
+            task.mark_incomplete()
 
 class TaskWithCategoriesAndTags(Task):
     """
     Extends the Task class to include categories and tags.
     Attributes:
         category (str): The category of the task.
-        tags (list): A list of tags associated with the task.
+        tags (frozenset): The set of tags associated with the task.
     """
+    __slots__ = ("category", "_category_path", "tags")
+
     def __init__(self, title: str, description: str, status: str = "incomplete", category: str = None, tags: list = None):
         """
         Initializes a new TaskWithCategoriesAndTags instance.
@@ -114,13 +181,56 @@ class TaskWithCategoriesAndTags(Task):
             tags (list): A list of tags associated with the task (optional).
         """
         super().__init__(title, description, status)
-        self.category = category
-        self.tags = tags or []
+        # Interned so that index lookups and tag comparisons resolve on identity
+        self.category = _intern(category)
+        self._category_path = tuple(map(_intern, category.split("/"))) if category and isinstance(category, str) else ()
+        self.tags = frozenset(map(_intern, tags)) if tags else frozenset()
 
 class TaskManagerWithCategoriesAndTags(TaskManager):
     """
     Extends TaskManager to add functionality for managing categories and tags.
+    Category and tag queries are answered from indexes maintained as tasks are added and removed.
     """
+    def __init__(self):
+        """
+        Initializes a new TaskManagerWithCategoriesAndTags instance with empty category and tag indexes.
+        """
+        super().__init__()
+        self._order = {}  # Maps each task to its insertion sequence number, used to keep results in list order
+        self._sequence = count()
+        self._by_category = {}  # Maps each category to its tasks (dict used as an ordered set)
+        self._by_category_path = {}  # Maps each split category path to its tasks (dict used as an ordered set)
+        self._by_tag = {}  # Maps each tag to its tasks (dict used as an ordered set)
+
+    def _index_task(self, task: Task):
+        """
+        Registers a task in the title index and, for categorized tasks, in the category and tag indexes.
+        Args:
+            task (Task): The task to register.
+        """
+        super()._index_task(task)
+        self._order[task] = next(self._sequence)
+        if isinstance(task, TaskWithCategoriesAndTags):
+            self._by_category.setdefault(task.category, {})[task] = None
+            if task._category_path:
+                self._by_category_path.setdefault(task._category_path, {})[task] = None
+            for tag in task.tags:
+                self._by_tag.setdefault(tag, {})[task] = None
+
+    @staticmethod
+    def _unindex(index: dict, key, task: Task):
+        """
+        Removes a task from one bucket of a category or tag index, dropping the bucket once empty.
+        Args:
+            index (dict): The index to update.
+            key: The category or tag the task is filed under.
+            task (Task): The task to remove.
+        """
+        bucket = index[key]
+        del bucket[task]
+        if not bucket:
+            del index[key]
+
     def add_task(self, title: str, description: str, category: str = None, tags: list = None):
         """
         Adds a new task with a category and tags to the task list.
@@ -132,6 +242,35 @@ class TaskManagerWithCategoriesAndTags(TaskManager):
         """
         task = TaskWithCategoriesAndTags(title, description, category=category, tags=tags)
         self.tasks.append(task)
+        self._index_task(task)
+
+    def add_tasks(self, rows):
+        """
+        Adds several tasks to the task list in one call.
+        Args:
+            rows (iterable): Dictionaries of TaskWithCategoriesAndTags arguments, each with at least a "title"
+                and a "description", and optionally "category" and "tags".
+        """
+        new_tasks = [TaskWithCategoriesAndTags(**row) for row in rows]
+        self.tasks.extend(new_tasks)
+        for task in new_tasks:
+            self._index_task(task)
+
+    def remove_task(self, title: str):
+        """
+        Removes a task from the task list and from the category and tag indexes based on its title.
+        Args:
+            title (str): The title of the task to be removed.
+        """
+        for task in self._by_title.get(title, ()):
+            del self._order[task]
+            if isinstance(task, TaskWithCategoriesAndTags):
+                self._unindex(self._by_category, task.category, task)
+                if task._category_path:
+                    self._unindex(self._by_category_path, task._category_path, task)
+                for tag in task.tags:
+                    self._unindex(self._by_tag, tag, task)
+        super().remove_task(title)
 
     def filter_tasks_by_category(self, category: str):
         """
@@ -141,7 +280,7 @@ class TaskManagerWithCategoriesAndTags(TaskManager):
         Returns:
             list: A list of tasks matching the specified category.
         """
-        return [task for task in self.tasks if isinstance(task, TaskWithCategoriesAndTags) and task.category == category]
+        return list(self._by_category.get(category, ()))
 
     def search_tasks_by_tags(self, tags: list):
         """
@@ -149,12 +288,12 @@ class TaskManagerWithCategoriesAndTags(TaskManager):
         Args:
             tags (list): A list of tags to search for.
         Returns:
-            list: A list of tasks containing any of the specified tags.
+            list: A list of tasks containing any of the specified tags, each listed once, in task-list order.
         """
-        return [
-            task for task in self.tasks
-            if isinstance(task, TaskWithCategoriesAndTags) and any(tag in task.tags for tag in tags)
-        ]
+        matches = set()
+        for tag in set(map(_intern, tags)):
+            matches.update(self._by_tag.get(tag, ()))
+        return sorted(matches, key=self._order.__getitem__)
 
     def filter_tasks_by_nested_category(self, category_hierarchy: list):
         """
@@ -164,9 +303,4 @@ class TaskManagerWithCategoriesAndTags(TaskManager):
         Returns:
             list: A list of tasks matching the specified nested category.
         """
-        return [
-            task for task in self.tasks
-            if isinstance(task, TaskWithCategoriesAndTags) and task.category and task.category.split("/") == category_hierarchy
-        ]
-
-
+        return list(self._by_category_path.get(tuple(category_hierarchy), ()))
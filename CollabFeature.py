@@ -3,8 +3,6 @@
 # (either "incomplete" or "complete"). The TaskManager provides methods to add, remove, list tasks, and
 # update their status.
 
-import json
-import os
 from datetime import datetime
 
 class Task:
@@ -14,7 +12,15 @@ class Task:
         title (str): The title of the task.
         description (str): A brief description of the task.
         status (str): The status of the task, either "incomplete" or "complete".
+        status_code (int): The status encoded as Task.INCOMPLETE or Task.COMPLETE.
+        comments (list): Comments added to the task, or None until the first comment.
     """
+    __slots__ = ("title", "description", "status_code", "comments")
+
+    INCOMPLETE = 0
+    COMPLETE = 1
+    _STATUS_NAMES = ("incomplete", "complete")
+
     def __init__(self, title: str, description: str, status: str = "incomplete"):
         """
         Initializes a new Task instance.
@@ -26,18 +32,124 @@ class Task:
         self.title = title
         self.description = description
         self.status = status
+        self.comments = None
+
+    @property
+    def status(self):
+        """
+        Returns the status of the task as a string, either "incomplete" or "complete".
+        """
+        return Task._STATUS_NAMES[self.status_code]
+
+    @status.setter
+    def status(self, status: str):
+        """
+        Sets the status of the task from its string form.
+        Args:
+            status (str): The new status, either "incomplete" or "complete".
+        """
+        self.status_code = Task.COMPLETE if status == "complete" else Task.INCOMPLETE
 
     def mark_complete(self):
         """
         Marks the task as complete by setting its status to "complete".
         """
-        self.status = "complete"
+        self.status_code = Task.COMPLETE
 
     def mark_incomplete(self):
         """
         Marks the task as incomplete by setting its status to "incomplete".
         """
-        self.status = "incomplete"
+        self.status_code = Task.INCOMPLETE
+
+class SharedTaskView:
+    """
+    A reference to another user's task, shared with a given permission level.
+    Reads pass through to the original task, so changes made by either user are visible to both.
+    Edit views may change the task's status and comments; read views may change neither, and return
+    the comments as a tuple.
+    Attributes:
+        permission (str): The access level on the shared task, either "edit" or "read".
+    """
+    __slots__ = ("_task", "permission")
+
+    def __init__(self, task: Task, permission: str = "read"):
+        """
+        Initializes a new SharedTaskView instance.
+        Args:
+            task (Task): The task being shared.
+            permission (str): The permission level ("read" or "edit", default is "read").
+        """
+        self._task = task
+        self.permission = permission
+
+    @property
+    def title(self):
+        """
+        Returns the title of the shared task.
+        """
+        return self._task.title
+
+    @property
+    def description(self):
+        """
+        Returns the description of the shared task.
+        """
+        return self._task.description
+
+    @property
+    def status(self):
+        """
+        Returns the status of the shared task, either "incomplete" or "complete".
+        """
+        return self._task.status
+
+    @property
+    def status_code(self):
+        """
+        Returns the status of the shared task encoded as Task.INCOMPLETE or Task.COMPLETE.
+        """
+        return self._task.status_code
+
+    @property
+    def comments(self):
+        """
+        Returns the comments on the shared task, as a tuple for read-only views.
+        """
+        comments = self._task.comments
+        if comments is not None and self.permission == "read":
+            return tuple(comments)
+        return comments
+
+    @comments.setter
+    def comments(self, comments: list):
+        """
+        Sets the comments on the shared task, unless the view is read-only.
+        Args:
+            comments (list): The new list of comments.
+        """
+        if self.permission == "read":
+            print("Permission denied: Read-only access.")
+            return
+        self._task.comments = comments
+
+    def mark_complete(self):
+        """
+        Marks the shared task as complete, unless the view is read-only.
+        """
+        if self.permission == "read":
+            print("Permission denied: Read-only access.")
+            return
+        self._task.mark_complete()
+
+    def mark_incomplete(self):
+        """
+        Marks the shared task as incomplete, unless the view is read-only.
+        """
+        if self.permission == "read":
+            print("Permission denied: Read-only access.")
+            return
+        self._task.mark_incomplete()
 
 class TaskManager:
     """
@@ -50,6 +162,15 @@ class TaskManager:
         Initializes a new TaskManager instance with an empty task list.
         """
         self.tasks = []
+        self._by_title = {}  # Maps each title to the tasks carrying it, in insertion order
+
+    def _index_task(self, task: Task):
+        """
+        Registers a task in the title index so lookups by title avoid scanning the task list.
+        Args:
+            task (Task): The task to register.
+        """
+        self._by_title.setdefault(task.title, []).append(task)
 
     def add_task(self, title: str, description: str):
         """
@@ -60,6 +181,18 @@ class TaskManager:
         """
         task = Task(title, description)
         self.tasks.append(task)
+        self._index_task(task)
+
+    def add_tasks(self, rows):
+        """
+        Adds several tasks to the task list in one call.
+        Args:
+            rows (iterable): Dictionaries of Task arguments, each with at least a "title" and a "description".
+        """
+        new_tasks = [Task(**row) for row in rows]
+        self.tasks.extend(new_tasks)
+        for task in new_tasks:
+            self._index_task(task)
 
     def remove_task(self, title: str):
         """
@@ -67,14 +200,26 @@ class TaskManager:
         Args:
             title (str): The title of the task to be removed.
         """
-        self.tasks = [task for task in self.tasks if task.title != title]
+        removed = self._by_title.pop(title, None)
+        if removed is None:
+            return
+        if len(removed) == 1:
+            self.tasks.remove(removed[0])
+            return
+        # Several tasks share the title: compact the survivors in place, keeping their order
+        kept = 0
+        for task in self.tasks:
+            if task.title != title:
+                self.tasks[kept] = task
+                kept += 1
+        del self.tasks[kept:]
 
     def list_tasks(self):
         """
         Lists all tasks in the task list, displaying their title, description, and status.
         """
-        for task in self.tasks:
-            print(f"Title: {task.title}, Description: {task.description}, Status: {task.status}")
+        if self.tasks:
+            print("\n".join([f"Title: {task.title}, Description: {task.description}, Status: {task.status}" for task in self.tasks]))
 
     def mark_task_complete(self, title: str):
         """
@@ -82,9 +227,8 @@ class TaskManager:
         Args:
             title (str): The title of the task to be marked as complete.
         """
-        for task in self.tasks:
-            if task.title == title:
-                task.mark_complete()
+        for task in self._by_title.get(title, ()):
+            task.mark_complete()
 
     def mark_task_incomplete(self, title: str):
         """
@@ -92,9 +236,8 @@ class TaskManager:
         Args:
             title (str): The title of the task to be marked as incomplete.
         """
-        for task in self.tasks:
-            if task.title == title:
-                task.mark_incomplete()
+        for task in self._by_title.get(title, ()):
+            task.mark_incomplete()
 
 class User:
     """
@@ -158,11 +301,9 @@ class CollaborationManager:
             print(f"Task '{task_title}' not found for user '{from_user}'.")
             return
 
-        shared_task = Task(task_to_share.title, task_to_share.description, task_to_share.status)
-        if permission == "read":
-            shared_task.mark_complete = lambda: print("Permission denied: Read-only access.")
-            shared_task.mark_incomplete = lambda: print("Permission denied: Read-only access.")
+        shared_task = SharedTaskView(task_to_share, permission)
         to_user_tasks.tasks.append(shared_task)
+        to_user_tasks._index_task(shared_task)
         print(f"Task '{task_title}' shared from '{from_user}' to '{to_user}' with '{permission}' permission.")
 
     # Expansion B: Task Comments
@@ -184,9 +325,15 @@ class CollaborationManager:
             print(f"Task '{task_title}' not found for user '{username}'.")
             return
 
-        if not hasattr(task_to_comment, "comments"):
-            task_to_comment.comments = []
-        task_to_comment.comments.append(comment)
+        # Comments on a shared task go to the owner's task, so read-only recipients may not add them
+        if isinstance(task_to_comment, SharedTaskView) and task_to_comment.permission == "read":
+            print("Permission denied: Read-only access.")
+            return
+
+        if task_to_comment.comments is None:
+            task_to_comment.comments = [comment]
+        else:
+            task_to_comment.comments.append(comment)
         print(f"Comment added to task '{task_title}' for user '{username}'.")
 
 
@@ -3,9 +3,9 @@
 # (either "incomplete" or "complete"). The TaskManager provides methods to add, remove, list tasks, and
 # update their status.
 
-import json
-import os
 from datetime import datetime, timedelta
+from enum import IntEnum
+from operator import attrgetter
 
 class Task:
     """
@@ -14,7 +14,14 @@ class Task:
         title (str): The title of the task.
         description (str): A brief description of the task.
         status (str): The status of the task, either "incomplete" or "complete".
+        status_code (int): The status encoded as Task.INCOMPLETE or Task.COMPLETE.
     """
+    __slots__ = ("title", "description", "status_code")
+
+    INCOMPLETE = 0
+    COMPLETE = 1
+    _STATUS_NAMES = ("incomplete", "complete")
+
     def __init__(self, title: str, description: str, status: str = "incomplete"):
         """
         Initializes a new Task instance.
@@ -27,25 +34,77 @@ class Task:
         self.description = description
         self.status = status
 
+    @property
+    def status(self):
+        """
+        Returns the status of the task as a string, either "incomplete" or "complete".
+        """
+        return Task._STATUS_NAMES[self.status_code]
+
+    @status.setter
+    def status(self, status: str):
+        """
+        Sets the status of the task from its string form.
+        Args:
+            status (str): The new status, either "incomplete" or "complete".
+        """
+        self.status_code = Task.COMPLETE if status == "complete" else Task.INCOMPLETE
+
     def mark_complete(self):
         """
         Marks the task as complete by setting its status to "complete".
         """
-        self.status = "complete"
+        self.status_code = Task.COMPLETE
 
     def mark_incomplete(self):
         """
         Marks the task as incomplete by setting its status to "incomplete".
         """
-        self.status = "incomplete"
+        self.status_code = Task.INCOMPLETE
+
+class Priority(IntEnum):
+    """
+    Priority levels of a task. Values follow sort order, so higher priorities compare lower.
+    """
+    HIGH = 1
+    MEDIUM = 2
+    LOW = 3
+
+    def __str__(self):
+        """
+        Returns the lowercase name of the priority level (e.g., "high").
+        """
+        return self.name.lower()
+
+    @classmethod
+    def from_name(cls, name: str):
+        """
+        Looks up a priority level by name, ignoring case.
+        Args:
+            name (str): The name of the priority level ("low", "medium", "high").
+        Returns:
+            Priority: The matching priority level.
+        Raises:
+            ValueError: If the name is not a known priority level.
+        """
+        try:
+            return cls[name.upper()]
+        except KeyError:
+            raise ValueError(f"Invalid priority '{name}'. Valid priorities are: high, medium, low.") from None
 
 class TaskWithDueDateAndPriority(Task):
     """
     Extends the Task class to include due dates and priority levels.
     Attributes:
         due_date (datetime): The due date of the task.
-        priority (str): The priority level of the task ("low", "medium", "high").
+        due_ordinal (int): The proleptic Gregorian ordinal of the due date, used as the sort key.
+            Tasks without a due date get an ordinal past datetime.max so they sort last.
+        priority (Priority): The priority level of the task.
     """
+    __slots__ = ("due_date", "due_ordinal", "priority")
+
+    _NO_DUE_DATE = datetime.max.toordinal() + 1
+
     def __init__(self, title: str, description: str, status: str = "incomplete", due_date: str = None, priority: str = "medium"):
         """
         Initializes a new TaskWithDueDateAndPriority instance.
@@ -54,11 +113,20 @@ class TaskWithDueDateAndPriority(Task):
             description (str): A brief description of the task.
             status (str): The initial status of the task (default is "incomplete").
             due_date (str): The due date of the task in "YYYY-MM-DD" format (optional).
-            priority (str): The priority level of the task (default is "medium").
+            priority (str): The priority level of the task, as a name or a Priority (default is "medium").
+                None is treated as "medium".
+        Raises:
+            ValueError: If the due date is not a valid "YYYY-MM-DD" date or the priority is not a known priority level.
         """
         super().__init__(title, description, status)
         self.due_date = datetime.strptime(due_date, "%Y-%m-%d") if due_date else None
-        self.priority = priority
+        self.due_ordinal = self.due_date.toordinal() if self.due_date is not None else TaskWithDueDateAndPriority._NO_DUE_DATE
+        if priority is None:
+            self.priority = Priority.MEDIUM
+        elif isinstance(priority, str):
+            self.priority = Priority.from_name(priority)
+        else:
+            self.priority = Priority(priority)
 
     def is_due_soon(self, days: int = 3):
         """
@@ -83,6 +151,15 @@ class TaskManager:
         Initializes a new TaskManager instance with an empty task list.
         """
         self.tasks = []
+        self._by_title = {}  # Maps each title to the tasks carrying it, in insertion order
+
+    def _index_task(self, task: Task):
+        """
+        Registers a task in the title index so lookups by title avoid scanning the task list.
+        Args:
+            task (Task): The task to register.
+        """
+        self._by_title.setdefault(task.title, []).append(task)
 
     def add_task(self, title: str, description: str):
         """
@@ -93,6 +170,18 @@ class TaskManager:
         """
         task = Task(title, description)
         self.tasks.append(task)
+        self._index_task(task)
+
+    def add_tasks(self, rows):
+        """
+        Adds several tasks to the task list in one call.
+        Args:
+            rows (iterable): Dictionaries of Task arguments, each with at least a "title" and a "description".
+        """
+        new_tasks = [Task(**row) for row in rows]
+        self.tasks.extend(new_tasks)
+        for task in new_tasks:
+            self._index_task(task)
 
     def remove_task(self, title: str):
         """
@@ -100,14 +189,26 @@ class TaskManager:
         Args:
             title (str): The title of the task to be removed.
         """
-        self.tasks = [task for task in self.tasks if task.title != title]
+        removed = self._by_title.pop(title, None)
+        if removed is None:
+            return
+        if len(removed) == 1:
+            self.tasks.remove(removed[0])
+            return
+        # Several tasks share the title: compact the survivors in place, keeping their order
+        kept = 0
+        for task in self.tasks:
+            if task.title != title:
+                self.tasks[kept] = task
+                kept += 1
+        del self.tasks[kept:]
 
     def list_tasks(self):
         """
         Lists all tasks in the task list, displaying their title, description, and status.
         """
-        for task in self.tasks:
-            print(f"Title: {task.title}, Description: {task.description}, Status: {task.status}")
+        if self.tasks:
+            print("\n".join([f"Title: {task.title}, Description: {task.description}, Status: {task.status}" for task in self.tasks]))
 
     def mark_task_complete(self, title: str):
         """
@@ -115,9 +216,8 @@ class TaskManager:
         Args:
             title (str): The title of the task to be marked as complete.
         """
-        for task in self.tasks:
-            if task.title == title:
-                task.mark_complete()
+        for task in self._by_title.get(title, ()):
+            task.mark_complete()
 
     def mark_task_incomplete(self, title: str):
         """
@@ -125,9 +225,8 @@ class TaskManager:
         Args:
             title (str): The title of the task to be marked as incomplete.
         """
-        for task in self.tasks:
-            if task.title == title:
-                task.mark_incomplete()
+        for task in self._by_title.get(title, ()):
+            task.mark_incomplete()
 
 
 
@@ -145,28 +244,44 @@ class TaskManagerWithDueDatesAndSorting(TaskManager):
             description (str): A brief description of the task.
             due_date (str): The due date of the task in "YYYY-MM-DD" format (optional).
             priority (str): The priority level of the task (default is "medium").
+        Raises:
+            ValueError: If the due date is not a valid "YYYY-MM-DD" date or the priority is not a known priority level.
         """
         task = TaskWithDueDateAndPriority(title, description, due_date=due_date, priority=priority)
         self.tasks.append(task)
+        self._index_task(task)
+
+    def add_tasks(self, rows):
+        """
+        Adds several tasks to the task list in one call.
+        Args:
+            rows (iterable): Dictionaries of TaskWithDueDateAndPriority arguments, each with at least a "title"
+                and a "description", and optionally "due_date" and "priority".
+        Raises:
+            ValueError: If a row has an invalid due date or priority; no tasks are added in that case.
+        """
+        new_tasks = [TaskWithDueDateAndPriority(**row) for row in rows]
+        self.tasks.extend(new_tasks)
+        for task in new_tasks:
+            self._index_task(task)
 
     def sort_tasks_by_due_date(self):
         """
         Sorts tasks by their due date in ascending order. Tasks without a due date are placed at the end.
         """
-        self.tasks.sort(key=lambda task: task.due_date or datetime.max)
+        self.tasks.sort(key=attrgetter("due_ordinal"))
 
     def sort_tasks_by_priority(self):
         """
         Sorts tasks by their priority level in the order: high, medium, low.
         """
-        priority_order = {"high": 1, "medium": 2, "low": 3}
-        self.tasks.sort(key=lambda task: priority_order.get(task.priority, 4))
+        self.tasks.sort(key=attrgetter("priority"))
 
     def sort_tasks_by_status(self):
         """
         Sorts tasks by their status, placing "incomplete" tasks before "complete" tasks.
         """
-        self.tasks.sort(key=lambda task: task.status)
+        self.tasks.sort(key=attrgetter("status_code"))
 
     def list_due_soon_tasks(self, days: int = 3):
         """
@@ -174,9 +289,16 @@ class TaskManagerWithDueDatesAndSorting(TaskManager):
         Args:
             days (int): The number of days to check for upcoming due dates.
         """
-        due_soon_tasks = [task for task in self.tasks if isinstance(task, TaskWithDueDateAndPriority) and task.is_due_soon(days)]
-        for task in due_soon_tasks:
-            print(f"Title: {task.title}, Due Date: {task.due_date.strftime('%Y-%m-%d')}, Priority: {task.priority}")
+        cutoff = datetime.now() + timedelta(days=days)
+        due_soon_tasks = [
+            task for task in self.tasks
+            if isinstance(task, TaskWithDueDateAndPriority) and task.due_date is not None and task.due_date <= cutoff
+        ]
+        if due_soon_tasks:
+            print("\n".join([
+                f"Title: {task.title}, Due Date: {task.due_date.strftime('%Y-%m-%d')}, Priority: {task.priority}"
+                for task in due_soon_tasks
+            ]))
 
 # Example usage:
 if __name__ == "__main__":
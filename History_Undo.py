@@ -5,6 +5,7 @@
 
 import json
 import os
+from contextlib import contextmanager
 from datetime import datetime
 
 class Task:
@@ -14,7 +15,14 @@ class Task:
         title (str): The title of the task.
         description (str): A brief description of the task.
         status (str): The status of the task, either "incomplete" or "complete".
+        status_code (int): The status encoded as Task.INCOMPLETE or Task.COMPLETE.
     """
+    __slots__ = ("title", "description", "status_code")
+
+    INCOMPLETE = 0
+    COMPLETE = 1
+    _STATUS_NAMES = ("incomplete", "complete")
+
     def __init__(self, title: str, description: str, status: str = "incomplete"):
         """
         Initializes a new Task instance.
@@ -27,17 +35,33 @@ class Task:
         self.description = description
         self.status = status
 
+    @property
+    def status(self):
+        """
+        Returns the status of the task as a string, either "incomplete" or "complete".
+        """
+        return Task._STATUS_NAMES[self.status_code]
+
+    @status.setter
+    def status(self, status: str):
+        """
+        Sets the status of the task from its string form.
+        Args:
+            status (str): The new status, either "incomplete" or "complete".
+        """
+        self.status_code = Task.COMPLETE if status == "complete" else Task.INCOMPLETE
+
     def mark_complete(self):
         """
         Marks the task as complete by setting its status to "complete".
         """
-        self.status = "complete"
+        self.status_code = Task.COMPLETE
 
     def mark_incomplete(self):
         """
         Marks the task as incomplete by setting its status to "incomplete".
         """
-        self.status = "incomplete"
+        self.status_code = Task.INCOMPLETE
 
 class TaskManager:
     """
@@ -50,6 +74,15 @@ class TaskManager:
         Initializes a new TaskManager instance with an empty task list.
         """
         self.tasks = []
+        self._by_title = {}  # Maps each title to the tasks carrying it, in insertion order
+
+    def _index_task(self, task: Task):
+        """
+        Registers a task in the title index so lookups by title avoid scanning the task list.
+        Args:
+            task (Task): The task to register.
+        """
+        self._by_title.setdefault(task.title, []).append(task)
 
     def add_task(self, title: str, description: str):
         """
@@ -60,6 +93,18 @@ class TaskManager:
         """
         task = Task(title, description)
         self.tasks.append(task)
+        self._index_task(task)
+
+    def add_tasks(self, rows):
+        """
+        Adds several tasks to the task list in one call.
+        Args:
+            rows (iterable): Dictionaries of Task arguments, each with at least a "title" and a "description".
+        """
+        new_tasks = [Task(**row) for row in rows]
+        self.tasks.extend(new_tasks)
+        for task in new_tasks:
+            self._index_task(task)
 
     def remove_task(self, title: str):
         """
@@ -67,14 +112,26 @@ class TaskManager:
         Args:
             title (str): The title of the task to be removed.
         """
-        self.tasks = [task for task in self.tasks if task.title != title]
+        removed = self._by_title.pop(title, None)
+        if removed is None:
+            return
+        if len(removed) == 1:
+            self.tasks.remove(removed[0])
+            return
+        # Several tasks share the title: compact the survivors in place, keeping their order
+        kept = 0
+        for task in self.tasks:
+            if task.title != title:
+                self.tasks[kept] = task
+                kept += 1
+        del self.tasks[kept:]
 
     def list_tasks(self):
         """
         Lists all tasks in the task list, displaying their title, description, and status.
         """
-        for task in self.tasks:
-            print(f"Title: {task.title}, Description: {task.description}, Status: {task.status}")
+        if self.tasks:
+            print("\n".join([f"Title: {task.title}, Description: {task.description}, Status: {task.status}" for task in self.tasks]))
 
     def mark_task_complete(self, title: str):
         """
@@ -82,9 +139,8 @@ class TaskManager:
         Args:
             title (str): The title of the task to be marked as complete.
         """
-        for task in self.tasks:
-            if task.title == title:
-                task.mark_complete()
+        for task in self._by_title.get(title, ()):
+            task.mark_complete()
 
     def mark_task_incomplete(self, title: str):
         """
@@ -92,74 +148,216 @@ class TaskManager:
         Args:
             title (str): The title of the task to be marked as incomplete.
         """
-        for task in self.tasks:
-            if task.title == title:
-                task.mark_incomplete()
+        for task in self._by_title.get(title, ()):
+            task.mark_incomplete()
 
 class TaskManagerWithHistory(TaskManager):
     """
     Extends TaskManager to include undo and redo functionality.
+    Each operation is recorded as a small delta that can be reverted and reapplied, instead of a copy of
+    the whole task list. Records hold the affected Task objects themselves:
+        ("add", [task, ...]): the tasks were appended to the list.
+        ("remove", [(index, task), ...]): the tasks were removed from the given positions (ascending).
+        ("status", [(task, previous_code), ...], new_code): the tasks' status_code was changed.
+        ("batch", [record, ...]): the records were made inside one transaction, oldest first.
+        ("state", [(task, title, description, status_code), ...]): the whole list was saved by save_state.
+            Reverting or reapplying it swaps it with the list's current contents.
     """
     def __init__(self):
         """
         Initializes a new TaskManagerWithHistory instance with undo and redo stacks.
         """
         super().__init__()
-        self.history = []  # Stack to store previous states for undo
-        self.redo_stack = []  # Stack to store states for redo
+        self.history = []  # Stack of operation records for undo
+        self.redo_stack = []  # Stack of undone operation records for redo
+        self._tx_depth = 0  # Number of transactions currently open
+        self._tx_records = []  # Records made inside the open transaction
+
+    def _unindex_task(self, task: Task):
+        """
+        Removes a single task from the title index.
+        Args:
+            task (Task): The task to remove.
+        """
+        bucket = self._by_title[task.title]
+        bucket.remove(task)
+        if not bucket:
+            del self._by_title[task.title]
 
     # Expansion A: Multi-step Undo
     def save_state(self):
         """
-        Saves the current state of the task list to the history stack.
+        Saves the current state of the task list to the history stack, so that the next undo restores it.
+        The manager's own methods record their changes; this is for changes made to tasks directly.
+        """
+        self._record(self._snapshot())
+
+    def _snapshot(self):
+        """
+        Captures the contents of the task list and each task's fields.
+        Returns:
+            tuple: A "state" record.
+        """
+        return ("state", [(task, task.title, task.description, task.status_code) for task in self.tasks])
+
+    def _restore(self, record: tuple):
+        """
+        Replaces the contents of the task list with a saved state and rebuilds the title index.
+        Args:
+            record (tuple): The "state" record to restore.
+        Returns:
+            tuple: A "state" record of the contents that were replaced.
+        """
+        current = self._snapshot()
+        self.tasks[:] = [entry[0] for entry in record[1]]
+        self._by_title = {}
+        for task, title, description, status_code in record[1]:
+            task.title = title
+            task.description = description
+            task.status_code = status_code
+            self._index_task(task)
+        return current
+
+    def _record(self, record: tuple):
         """
-        self.history.append([task.__dict__.copy() for task in self.tasks])
+        Saves an operation record to the history stack.
+        Args:
+            record (tuple): The operation record, in one of the forms listed on the class.
+        """
+        if self._tx_depth:
+            self._tx_records.append(record)
+            return
+        self.history.append(record)
         self.redo_stack.clear()  # Clear redo stack whenever a new operation is performed
 
+    @contextmanager
+    def transaction(self):
+        """
+        Groups the operations made inside a with block into a single undo step.
+        Transactions may be nested; the operations are recorded when the outermost one ends,
+        including when it ends with an exception. Undo and redo are refused while a transaction is open.
+        """
+        self._tx_depth += 1
+        try:
+            yield self
+        finally:
+            self._tx_depth -= 1
+            if not self._tx_depth and self._tx_records:
+                records, self._tx_records = self._tx_records, []
+                self._record(records[0] if len(records) == 1 else ("batch", records))
+
+    def _revert(self, record: tuple):
+        """
+        Applies the inverse of an operation record to the task list.
+        Args:
+            record (tuple): The operation record to revert.
+        Returns:
+            tuple: The record that reapplies the operation.
+        """
+        kind = record[0]
+        if kind == "add":
+            added = set(record[1])
+            self.tasks[:] = [task for task in self.tasks if task not in added]
+            for task in record[1]:
+                self._unindex_task(task)
+        elif kind == "remove":
+            for index, task in record[1]:
+                self.tasks.insert(index, task)
+                self._index_task(task)
+        elif kind == "status":
+            for task, previous_code in record[1]:
+                task.status_code = previous_code
+        elif kind == "batch":
+            return ("batch", [self._revert(step) for step in reversed(record[1])][::-1])
+        elif kind == "state":
+            return self._restore(record)
+        return record
+
+    def _apply(self, record: tuple):
+        """
+        Reapplies an operation record to the task list.
+        Args:
+            record (tuple): The operation record to reapply.
+        Returns:
+            tuple: The record that reverts the operation again.
+        """
+        kind = record[0]
+        if kind == "add":
+            self.tasks.extend(record[1])
+            for task in record[1]:
+                self._index_task(task)
+        elif kind == "remove":
+            for index, task in reversed(record[1]):
+                del self.tasks[index]
+                self._unindex_task(task)
+        elif kind == "status":
+            for task, _ in record[1]:
+                task.status_code = record[2]
+        elif kind == "batch":
+            return ("batch", [self._apply(step) for step in record[1]])
+        elif kind == "state":
+            return self._restore(record)
+        return record
+
     def undo(self):
         """
-        Reverts the task list to the last saved state.
+        Reverts the last recorded operation.
         Raises:
             IndexError: If there is no state to undo.
         """
+        if self._tx_depth:
+            print("Cannot undo while a transaction is open.")
+            return
         if not self.history:
             print("No actions to undo.")
             return
-        self.redo_stack.append([task.__dict__.copy() for task in self.tasks])
-        previous_state = self.history.pop()
-        self.tasks = [Task(**task) for task in previous_state]
+        self.redo_stack.append(self._revert(self.history.pop()))
         print("Undo successful.")
 
     # Expansion B: Redo Functionality
     def redo(self):
         """
-        Reapplies the last undone state to the task list.
+        Reapplies the last undone operation.
         Raises:
             IndexError: If there is no state to redo.
         """
+        if self._tx_depth:
+            print("Cannot redo while a transaction is open.")
+            return
         if not self.redo_stack:
             print("No actions to redo.")
             return
-        self.history.append([task.__dict__.copy() for task in self.tasks])
-        next_state = self.redo_stack.pop()
-        self.tasks = [Task(**next_state) for next_state in next_state]
+        self.history.append(self._apply(self.redo_stack.pop()))
         print("Redo successful.")
 
-    # Override methods to include state saving
+    # Override methods to record an undoable delta for each operation
     def add_task(self, title: str, description: str):
-        self.save_state()
         super().add_task(title, description)
+        self._record(("add", [self.tasks[-1]]))
+
+    def add_tasks(self, rows):
+        start = len(self.tasks)
+        super().add_tasks(rows)
+        if len(self.tasks) > start:
+            self._record(("add", self.tasks[start:]))
 
     def remove_task(self, title: str):
-        self.save_state()
+        if title not in self._by_title:
+            return
+        removed = [(index, task) for index, task in enumerate(self.tasks) if task.title == title]
         super().remove_task(title)
+        self._record(("remove", removed))
 
     def mark_task_complete(self, title: str):
-        self.save_state()
+        changed = [(task, task.status_code) for task in self._by_title.get(title, ())]
+        if not changed:
+            return
         super().mark_task_complete(title)
+        self._record(("status", changed, Task.COMPLETE))
 
     def mark_task_incomplete(self, title: str):
-        self.save_state()
+        changed = [(task, task.status_code) for task in self._by_title.get(title, ())]
+        if not changed:
+            return
         super().mark_task_incomplete(title)
-
-
+        self._record(("status", changed, Task.INCOMPLETE))
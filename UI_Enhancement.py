@@ -6,7 +6,6 @@
 import json
 import os
 from datetime import datetime
-from collections import deque
 
 class Task:
     """
@@ -15,7 +14,14 @@ class Task:
         title (str): The title of the task.
         description (str): A brief description of the task.
         status (str): The status of the task, either "incomplete" or "complete".
+        status_code (int): The status encoded as Task.INCOMPLETE or Task.COMPLETE.
     """
+    __slots__ = ("title", "description", "status_code")
+
+    INCOMPLETE = 0
+    COMPLETE = 1
+    _STATUS_NAMES = ("incomplete", "complete")
+
     def __init__(self, title: str, description: str, status: str = "incomplete"):
         """
         Initializes a new Task instance.
@@ -28,17 +34,33 @@ class Task:
         self.description = description
         self.status = status
 
+    @property
+    def status(self):
+        """
+        Returns the status of the task as a string, either "incomplete" or "complete".
+        """
+        return Task._STATUS_NAMES[self.status_code]
+
+    @status.setter
+    def status(self, status: str):
+        """
+        Sets the status of the task from its string form.
+        Args:
+            status (str): The new status, either "incomplete" or "complete".
+        """
+        self.status_code = Task.COMPLETE if status == "complete" else Task.INCOMPLETE
+
     def mark_complete(self):
         """
         Marks the task as complete by setting its status to "complete".
         """
-        self.status = "complete"
+        self.status_code = Task.COMPLETE
 
     def mark_incomplete(self):
         """
         Marks the task as incomplete by setting its status to "incomplete".
         """
-        self.status = "incomplete"
+        self.status_code = Task.INCOMPLETE
 
 class TaskManager:
     """
@@ -51,6 +73,15 @@ class TaskManager:
         Initializes a new TaskManager instance with an empty task list.
         """
         self.tasks = []
+        self._by_title = {}  # Maps each title to the tasks carrying it, in insertion order
+
+    def _index_task(self, task: Task):
+        """
+        Registers a task in the title index so lookups by title avoid scanning the task list.
+        Args:
+            task (Task): The task to register.
+        """
+        self._by_title.setdefault(task.title, []).append(task)
 
     def add_task(self, title: str, description: str):
         """
@@ -61,6 +92,18 @@ class TaskManager:
         """
         task = Task(title, description)
         self.tasks.append(task)
+        self._index_task(task)
+
+    def add_tasks(self, rows):
+        """
+        Adds several tasks to the task list in one call.
+        Args:
+            rows (iterable): Dictionaries of Task arguments, each with at least a "title" and a "description".
+        """
+        new_tasks = [Task(**row) for row in rows]
+        self.tasks.extend(new_tasks)
+        for task in new_tasks:
+            self._index_task(task)
 
     def remove_task(self, title: str):
         """
@@ -68,14 +111,26 @@ class TaskManager:
         Args:
             title (str): The title of the task to be removed.
         """
-        self.tasks = [task for task in self.tasks if task.title != title]
+        removed = self._by_title.pop(title, None)
+        if removed is None:
+            return
+        if len(removed) == 1:
+            self.tasks.remove(removed[0])
+            return
+        # Several tasks share the title: compact the survivors in place, keeping their order
+        kept = 0
+        for task in self.tasks:
+            if task.title != title:
+                self.tasks[kept] = task
+                kept += 1
+        del self.tasks[kept:]
 
     def list_tasks(self):
         """
         Lists all tasks in the task list, displaying their title, description, and status.
         """
-        for task in self.tasks:
-            print(f"Title: {task.title}, Description: {task.description}, Status: {task.status}")
+        if self.tasks:
+            print("\n".join([f"Title: {task.title}, Description: {task.description}, Status: {task.status}" for task in self.tasks]))
 
     def mark_task_complete(self, title: str):
         """
@@ -83,9 +138,8 @@ class TaskManager:
         Args:
             title (str): The title of the task to be marked as complete.
         """
-        for task in self.tasks:
-            if task.title == title:
-                task.mark_complete()
+        for task in self._by_title.get(title, ()):
+            task.mark_complete()
 
     def mark_task_incomplete(self, title: str):
         """
@@ -93,15 +147,16 @@ class TaskManager:
         Args:
             title (str): The title of the task to be marked as incomplete.
         """
-        for task in self.tasks:
-            if task.title == title:
-                task.mark_incomplete()
+        for task in self._by_title.get(title, ()):
+            task.mark_incomplete()
 
 class ConsoleInterface:
     """
     Provides a menu-driven console interface for interacting with the task manager.
     Includes command history and theming options.
     """
+    HISTORY_SIZE = 50  # Number of recent commands kept in the history
+
     def __init__(self, task_manager: TaskManager):
         """
         Initializes the console interface.
@@ -109,8 +164,41 @@ class ConsoleInterface:
             task_manager (TaskManager): An instance of TaskManager to manage tasks.
         """
         self.task_manager = task_manager
-        self.command_history = deque(maxlen=50)  # Stores the last 50 commands
+        # Command history ring buffer: a fixed list overwritten in place once full
+        self._history = [None] * ConsoleInterface.HISTORY_SIZE
+        self._history_next = 0  # Slot the next command is written to
+        self._history_count = 0  # Number of slots filled so far
         self.theme = "default"  # Default theme
+        self._commands = {  # Maps each menu choice to its handler
+            "1": self._cmd_add,
+            "2": self._cmd_remove,
+            "3": self._cmd_list,
+            "4": self._cmd_complete,
+            "5": self._cmd_incomplete,
+            "6": self._cmd_history,
+            "7": self.change_theme,
+            "8": self._cmd_exit,
+        }
+
+    @property
+    def command_history(self):
+        """
+        Returns the recorded commands, oldest first, up to the last HISTORY_SIZE commands.
+        """
+        if self._history_count < ConsoleInterface.HISTORY_SIZE:
+            return self._history[:self._history_count]
+        return self._history[self._history_next:] + self._history[:self._history_next]
+
+    def _record_command(self, command: str):
+        """
+        Stores a command in the history, overwriting the oldest entry once the history is full.
+        Args:
+            command (str): The command entered by the user.
+        """
+        self._history[self._history_next] = command
+        self._history_next = (self._history_next + 1) % ConsoleInterface.HISTORY_SIZE
+        if self._history_count < ConsoleInterface.HISTORY_SIZE:
+            self._history_count += 1
 
     def display_menu(self):
         """
@@ -132,38 +220,68 @@ class ConsoleInterface:
         Args:
             command (str): The command entered by the user.
         """
-        self.command_history.append(command)  # Save command to history
-
-        if command == "1":
-            title = input("Enter task title: ")
-            description = input("Enter task description: ")
-            self.task_manager.add_task(title, description)
-            print("Task added successfully.")
-        elif command == "2":
-            title = input("Enter task title to remove: ")
-            self.task_manager.remove_task(title)
-            print("Task removed successfully.")
-        elif command == "3":
-            print("Listing all tasks:")
-            self.task_manager.list_tasks()
-        elif command == "4":
-            title = input("Enter task title to mark as complete: ")
-            self.task_manager.mark_task_complete(title)
-            print("Task marked as complete.")
-        elif command == "5":
-            title = input("Enter task title to mark as incomplete: ")
-            self.task_manager.mark_task_incomplete(title)
-            print("Task marked as incomplete.")
-        elif command == "6":
-            print("Command History:")
-            for i, cmd in enumerate(self.command_history, 1):
-                print(f"{i}. {cmd}")
-        elif command == "7":
-            self.change_theme()
-        elif command == "8":
-            print("Exiting Task Manager. Goodbye!")
-        else:
-            print("Invalid command. Please try again.")
+        self._record_command(command)  # Save command to history
+        self._commands.get(command, self._cmd_invalid)()
+
+    def _cmd_add(self):
+        """
+        Prompts for a title and description and adds the task.
+        """
+        title = input("Enter task title: ")
+        description = input("Enter task description: ")
+        self.task_manager.add_task(title, description)
+        print("Task added successfully.")
+
+    def _cmd_remove(self):
+        """
+        Prompts for a title and removes the matching task.
+        """
+        title = input("Enter task title to remove: ")
+        self.task_manager.remove_task(title)
+        print("Task removed successfully.")
+
+    def _cmd_list(self):
+        """
+        Lists all tasks.
+        """
+        print("Listing all tasks:")
+        self.task_manager.list_tasks()
+
+    def _cmd_complete(self):
+        """
+        Prompts for a title and marks the matching task as complete.
+        """
+        title = input("Enter task title to mark as complete: ")
+        self.task_manager.mark_task_complete(title)
+        print("Task marked as complete.")
+
+    def _cmd_incomplete(self):
+        """
+        Prompts for a title and marks the matching task as incomplete.
+        """
+        title = input("Enter task title to mark as incomplete: ")
+        self.task_manager.mark_task_incomplete(title)
+        print("Task marked as incomplete.")
+
+    def _cmd_history(self):
+        """
+        Displays the command history, oldest first.
+        """
+        print("Command History:")
+        for i, cmd in enumerate(self.command_history, 1):
+            print(f"{i}. {cmd}")
+
+    def _cmd_exit(self):
+        """
+        Prints the goodbye message.
+        """
+        print("Exiting Task Manager. Goodbye!")
+
+    def _cmd_invalid(self):
+        """
+        Reports an unrecognized menu choice.
+        """
+        print("Invalid command. Please try again.")
 
     def change_theme(self):
         """
@@ -5,7 +5,25 @@
 
 import json
 import os
+import re
+from collections import OrderedDict
 from datetime import datetime
+from functools import lru_cache
+from itertools import count
+from operator import attrgetter, countOf
+
+_WORD_PATTERN = re.compile(r"\w+")
+
+@lru_cache(maxsize=64)
+def _keyword_matcher(keywords: frozenset):
+    """
+    Builds a search function matching any of the given keywords in a single pass over a text.
+    Args:
+        keywords (frozenset): The lowercased keywords to match as substrings.
+    Returns:
+        callable: A function returning a match object if the text contains any keyword, None otherwise.
+    """
+    return re.compile("|".join(map(re.escape, keywords))).search
 
 class Task:
     """
@@ -14,7 +32,14 @@ class Task:
         title (str): The title of the task.
         description (str): A brief description of the task.
         status (str): The status of the task, either "incomplete" or "complete".
+        status_code (int): The status encoded as Task.INCOMPLETE or Task.COMPLETE.
     """
+    __slots__ = ("title", "description", "status_code", "_title_lc", "_desc_lc")
+
+    INCOMPLETE = 0
+    COMPLETE = 1
+    _STATUS_NAMES = ("incomplete", "complete")
+
     def __init__(self, title: str, description: str, status: str = "incomplete"):
         """
         Initializes a new Task instance.
@@ -26,18 +51,37 @@ class Task:
         self.title = title
         self.description = description
         self.status = status
+        # Lowercased copies for case-insensitive keyword search; titles and descriptions are not edited in place
+        self._title_lc = title.lower()
+        self._desc_lc = description.lower()
+
+    @property
+    def status(self):
+        """
+        Returns the status of the task as a string, either "incomplete" or "complete".
+        """
+        return Task._STATUS_NAMES[self.status_code]
+
+    @status.setter
+    def status(self, status: str):
+        """
+        Sets the status of the task from its string form.
+        Args:
+            status (str): The new status, either "incomplete" or "complete".
+        """
+        self.status_code = Task.COMPLETE if status == "complete" else Task.INCOMPLETE
 
     def mark_complete(self):
         """
         Marks the task as complete by setting its status to "complete".
         """
-        self.status = "complete"
+        self.status_code = Task.COMPLETE
 
     def mark_incomplete(self):
         """
         Marks the task as incomplete by setting its status to "incomplete".
         """
-        self.status = "incomplete"
+        self.status_code = Task.INCOMPLETE
 
 class TaskManager:
     """
@@ -50,6 +94,15 @@ class TaskManager:
         Initializes a new TaskManager instance with an empty task list.
         """
         self.tasks = []
+        self._by_title = {}  # Maps each title to the tasks carrying it, in insertion order
+
+    def _index_task(self, task: Task):
+        """
+        Registers a task in the title index so lookups by title avoid scanning the task list.
+        Args:
+            task (Task): The task to register.
+        """
+        self._by_title.setdefault(task.title, []).append(task)
 
     def add_task(self, title: str, description: str):
         """
@@ -60,6 +113,18 @@ class TaskManager:
         """
         task = Task(title, description)
         self.tasks.append(task)
+        self._index_task(task)
+
+    def add_tasks(self, rows):
+        """
+        Adds several tasks to the task list in one call.
+        Args:
+            rows (iterable): Dictionaries of Task arguments, each with at least a "title" and a "description".
+        """
+        new_tasks = [Task(**row) for row in rows]
+        self.tasks.extend(new_tasks)
+        for task in new_tasks:
+            self._index_task(task)
 
     def remove_task(self, title: str):
         """
@@ -67,14 +132,26 @@ class TaskManager:
         Args:
             title (str): The title of the task to be removed.
         """
-        self.tasks = [task for task in self.tasks if task.title != title]
+        removed = self._by_title.pop(title, None)
+        if removed is None:
+            return
+        if len(removed) == 1:
+            self.tasks.remove(removed[0])
+            return
+        # Several tasks share the title: compact the survivors in place, keeping their order
+        kept = 0
+        for task in self.tasks:
+            if task.title != title:
+                self.tasks[kept] = task
+                kept += 1
+        del self.tasks[kept:]
 
     def list_tasks(self):
         """
         Lists all tasks in the task list, displaying their title, description, and status.
         """
-        for task in self.tasks:
-            print(f"Title: {task.title}, Description: {task.description}, Status: {task.status}")
+        if self.tasks:
+            print("\n".join([f"Title: {task.title}, Description: {task.description}, Status: {task.status}" for task in self.tasks]))
 
     def mark_task_complete(self, title: str):
         """
@@ -82,9 +159,8 @@ class TaskManager:
         Args:
             title (str): The title of the task to be marked as complete.
         """
-        for task in self.tasks:
-            if task.title == title:
-                task.mark_complete()
+        for task in self._by_title.get(title, ()):
+            task.mark_complete()
 
     def mark_task_incomplete(self, title: str):
         """
@@ -92,9 +168,8 @@ class TaskManager:
         Args:
             title (str): The title of the task to be marked as incomplete.
         """
-        for task in self.tasks:
-            if task.title == title:
-                task.mark_incomplete()
+        for task in self._by_title.get(title, ()):
+            task.mark_incomplete()
 
 
 
@@ -104,7 +179,94 @@ class AdvancedTaskManager(TaskManager):
     """
     Extends TaskManager to add advanced querying functionality, including filtering by status,
     searching by keywords, multi-criteria filtering, and searching by multiple keywords.
+    Whole-word keyword searches are answered from a word index kept up to date by the add and remove
+    methods. Keyword search results are memoized until the next add or remove.
     """
+    SEARCH_CACHE_SIZE = 64  # Number of recent keyword searches whose results are kept
+
+    def __init__(self):
+        """
+        Initializes a new AdvancedTaskManager instance with an empty word index.
+        """
+        super().__init__()
+        self._version = 0  # Bumped whenever tasks are added or removed, so cached search results go stale
+        self._search_cache = OrderedDict()  # Maps (version, query) to its results, least recently used first
+        self._order = {}  # Maps each task to its insertion sequence number, used to keep results in list order
+        self._sequence = count()
+        self._by_word = {}  # Maps each lowercased word of a title or description to the set of tasks containing it
+
+    def _index_task(self, task: Task):
+        """
+        Registers a task in the title and word indexes.
+        Args:
+            task (Task): The task to register.
+        """
+        super()._index_task(task)
+        self._version += 1
+        self._order[task] = next(self._sequence)
+        for word in self._words(task):
+            self._by_word.setdefault(word, set()).add(task)
+
+    @staticmethod
+    def _words(task: Task):
+        """
+        Returns the distinct lowercased words of a task's title and description.
+        Args:
+            task (Task): The task to tokenize.
+        Returns:
+            set: The words found in the task.
+        """
+        return set(_WORD_PATTERN.findall(task._title_lc)).union(_WORD_PATTERN.findall(task._desc_lc))
+
+    def _in_list_order(self, tasks):
+        """
+        Returns the given tasks ordered as they appear in the task list.
+        Args:
+            tasks (iterable): Tasks managed by this instance.
+        Returns:
+            list: The tasks, in task-list order.
+        """
+        return sorted(tasks, key=self._order.__getitem__)
+
+    def _cached_search(self, query: tuple, search):
+        """
+        Returns the results of a keyword search, reusing those of an identical search made since the last
+        add or remove. Status changes do not affect keyword searches, so they leave cached results valid.
+        Args:
+            query (tuple): A hashable description of the search.
+            search (callable): Computes the results when they are not cached.
+        Returns:
+            list: A new list of the matching tasks.
+        """
+        key = (self._version, query)
+        cache = self._search_cache
+        results = cache.get(key)
+        if results is None:
+            results = cache[key] = search()
+            if len(cache) > AdvancedTaskManager.SEARCH_CACHE_SIZE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+        return list(results)
+
+    def remove_task(self, title: str):
+        """
+        Removes a task from the task list and the word index based on its title.
+        Args:
+            title (str): The title of the task to be removed.
+        """
+        if title not in self._by_title:
+            return
+        self._version += 1
+        for task in self._by_title.get(title, ()):
+            del self._order[task]
+            for word in self._words(task):
+                tasks = self._by_word[word]
+                tasks.discard(task)
+                if not tasks:
+                    del self._by_word[word]
+        super().remove_task(title)
+
     def filter_tasks_by_status(self, status: str):
         """
         Filters tasks based on their status (complete/incomplete).
@@ -113,17 +275,40 @@ class AdvancedTaskManager(TaskManager):
         Returns:
             list: A list of tasks matching the specified status.
         """
-        return [task for task in self.tasks if task.status == status]
+        if status not in Task._STATUS_NAMES:
+            return []
+        # Scanned rather than indexed: tasks handed out by queries can be marked directly through Task
+        code = Task._STATUS_NAMES.index(status)
+        return [task for task in self.tasks if task.status_code == code]
 
-    def search_tasks_by_keyword(self, keyword: str):
+    def count_tasks_by_status(self, status: str):
+        """
+        Counts the tasks with the given status without building the list of them.
+        Args:
+            status (str): The status to count ("complete" or "incomplete").
+        Returns:
+            int: The number of tasks with the specified status.
+        """
+        if status not in Task._STATUS_NAMES:
+            return 0
+        return countOf(map(attrgetter("status_code"), self.tasks), Task._STATUS_NAMES.index(status))
+
+    def search_tasks_by_keyword(self, keyword: str, whole_words: bool = False):
         """
         Searches for tasks that contain the specified keyword in their title or description.
         Args:
             keyword (str): The keyword to search for.
+            whole_words (bool): If True, only match the keyword as a whole word (see search_tasks_by_keywords).
         Returns:
             list: A list of tasks containing the keyword.
         """
-        return [task for task in self.tasks if keyword.lower() in task.title.lower() or keyword.lower() in task.description.lower()]
+        if whole_words:
+            return self.search_tasks_by_keywords([keyword], whole_words=True)
+        keyword = keyword.lower()
+        return self._cached_search(
+            ("keyword", keyword),
+            lambda: [task for task in self.tasks if keyword in task._title_lc or keyword in task._desc_lc],
+        )
 
     # Multi-criteria Filtering
     def filter_tasks(self, status: str = None, keywords: list = None):
@@ -138,29 +323,65 @@ class AdvancedTaskManager(TaskManager):
         filtered_tasks = self.tasks
 
         if status:
-            filtered_tasks = [task for task in filtered_tasks if task.status == status]
+            # Filter by status first so the keyword scan only visits tasks with that status
+            filtered_tasks = self.filter_tasks_by_status(status)
 
         if keywords:
-            filtered_tasks = [
-                task for task in filtered_tasks
-                if any(keyword.lower() in task.title.lower() or keyword.lower() in task.description.lower() for keyword in keywords)
-            ]
+            matches = _keyword_matcher(frozenset(keyword.lower() for keyword in keywords))
+            filtered_tasks = [task for task in filtered_tasks if matches(task._title_lc) or matches(task._desc_lc)]
 
         return filtered_tasks
 
     # Search by Multiple Keywords
-    def search_tasks_by_keywords(self, keywords: list):
+    def search_tasks_by_keywords(self, keywords: list, whole_words: bool = False):
         """
         Searches for tasks that contain any of the specified keywords in their title or description.
         Args:
             keywords (list): A list of keywords to search for.
+            whole_words (bool): If True, keywords that are single words are matched as whole words through
+                the word index instead of as substrings. Other keywords still match as substrings.
         Returns:
             list: A list of tasks containing any of the keywords.
         """
-        return [
-            task for task in self.tasks
-            if any(keyword.lower() in task.title.lower() or keyword.lower() in task.description.lower() for keyword in keywords)
-        ]
+        keywords = tuple(keyword.lower() for keyword in keywords)
+        return self._cached_search(("keywords", keywords, whole_words), lambda: self._search_keywords(keywords, whole_words))
+
+    def _search_keywords(self, keywords: tuple, whole_words: bool):
+        """
+        Scans for tasks containing any of the keywords; see search_tasks_by_keywords.
+        Args:
+            keywords (tuple): Lowercased keywords to search for.
+            whole_words (bool): If True, single-word keywords are matched as whole words.
+        Returns:
+            list: The matching tasks, in list order.
+        """
+        if whole_words:
+            matches = set()
+            substrings = []
+            for keyword in keywords:
+                if _WORD_PATTERN.fullmatch(keyword):
+                    matches.update(self._by_word.get(keyword, ()))
+                else:
+                    substrings.append(keyword)
+            if substrings:
+                matches.update(self._search_substrings(self.tasks, substrings))
+            return self._in_list_order(matches)
+        return self._search_substrings(self.tasks, keywords)
+
+    @staticmethod
+    def _search_substrings(tasks, keywords):
+        """
+        Selects the tasks whose title or description contains any of the keywords.
+        Args:
+            tasks (iterable): The tasks to search.
+            keywords (list or tuple): Lowercased keywords to match as substrings.
+        Returns:
+            list: The matching tasks, in the order given.
+        """
+        if not keywords:
+            return []
+        matches = _keyword_matcher(frozenset(keywords))
+        return [task for task in tasks if matches(task._title_lc) or matches(task._desc_lc)]
 
 
 
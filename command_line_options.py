@@ -14,7 +14,15 @@ class Task:
         title (str): The title of the task.
         description (str): A brief description of the task.
         status (str): The status of the task, either "incomplete" or "complete".
+        status_code (int): The status encoded as Task.INCOMPLETE or Task.COMPLETE.
     """
+    __slots__ = ("title", "description", "status_code")
+
+    INCOMPLETE = 0
+    COMPLETE = 1
+    _STATUS_NAMES = ("incomplete", "complete")
+    _FIELDS = frozenset(("title", "description", "status"))
+
     def __init__(self, title: str, description: str, status: str = "incomplete"):
         """
         Initializes a new Task instance.
@@ -27,17 +35,57 @@ class Task:
         self.description = description
         self.status = status
 
+    @classmethod
+    def _from_dict(cls, row: dict):
+        """
+        Creates a task from a dictionary of its fields, assigning the slots directly instead of going
+        through __init__ and keyword-argument unpacking. Used for bulk loading.
+        Args:
+            row (dict): The task's "title" and "description", and optionally its "status".
+        Returns:
+            Task: The new task.
+        Raises:
+            TypeError: If the row is missing a required field or has an unknown one, as Task(**row) would.
+        """
+        unknown = row.keys() - Task._FIELDS
+        if unknown:
+            raise TypeError(f"Task got unexpected fields: {', '.join(sorted(map(repr, unknown)))}")
+        task = cls.__new__(cls)
+        try:
+            task.title = row["title"]
+            task.description = row["description"]
+        except KeyError as e:
+            raise TypeError(f"Task is missing the required field {e}") from None
+        task.status_code = Task.COMPLETE if row.get("status") == "complete" else Task.INCOMPLETE
+        return task
+
+    @property
+    def status(self):
+        """
+        Returns the status of the task as a string, either "incomplete" or "complete".
+        """
+        return Task._STATUS_NAMES[self.status_code]
+
+    @status.setter
+    def status(self, status: str):
+        """
+        Sets the status of the task from its string form.
+        Args:
+            status (str): The new status, either "incomplete" or "complete".
+        """
+        self.status_code = Task.COMPLETE if status == "complete" else Task.INCOMPLETE
+
     def mark_complete(self):
         """
         Marks the task as complete by setting its status to "complete".
         """
-        self.status = "complete"
+        self.status_code = Task.COMPLETE
 
     def mark_incomplete(self):
         """
         Marks the task as incomplete by setting its status to "incomplete".
         """
-        self.status = "incomplete"
+        self.status_code = Task.INCOMPLETE
 
 class TaskManager:
     """
@@ -50,6 +98,15 @@ class TaskManager:
         Initializes a new TaskManager instance with an empty task list.
         """
         self.tasks = []
+        self._by_title = {}  # Maps each title to the tasks carrying it, in insertion order
+
+    def _index_task(self, task: Task):
+        """
+        Registers a task in the title index so lookups by title avoid scanning the task list.
+        Args:
+            task (Task): The task to register.
+        """
+        self._by_title.setdefault(task.title, []).append(task)
 
     def add_task(self, title: str, description: str):
         """
@@ -60,6 +117,21 @@ class TaskManager:
         """
         task = Task(title, description)
         self.tasks.append(task)
+        self._index_task(task)
+
+    def add_tasks(self, rows):
+        """
+        Adds several tasks to the task list in one call.
+        Args:
+            rows (iterable): Dictionaries of Task fields, each with a "title" and a "description",
+                and optionally a "status".
+        Raises:
+            TypeError: If a row is missing a required field or has an unknown one; no tasks are added in that case.
+        """
+        new_tasks = [Task._from_dict(row) for row in rows]
+        self.tasks.extend(new_tasks)
+        for task in new_tasks:
+            self._index_task(task)
 
     def remove_task(self, title: str):
         """
@@ -67,14 +139,26 @@ class TaskManager:
         Args:
             title (str): The title of the task to be removed.
         """
-        self.tasks = [task for task in self.tasks if task.title != title]
+        removed = self._by_title.pop(title, None)
+        if removed is None:
+            return
+        if len(removed) == 1:
+            self.tasks.remove(removed[0])
+            return
+        # Several tasks share the title: compact the survivors in place, keeping their order
+        kept = 0
+        for task in self.tasks:
+            if task.title != title:
+                self.tasks[kept] = task
+                kept += 1
+        del self.tasks[kept:]
 
     def list_tasks(self):
         """
         Lists all tasks in the task list, displaying their title, description, and status.
         """
-        for task in self.tasks:
-            print(f"Title: {task.title}, Description: {task.description}, Status: {task.status}")
+        if self.tasks:
+            print("\n".join([f"Title: {task.title}, Description: {task.description}, Status: {task.status}" for task in self.tasks]))
 
     def mark_task_complete(self, title: str):
         """
@@ -82,9 +166,8 @@ class TaskManager:
         Args:
             title (str): The title of the task to be marked as complete.
         """
-        for task in self.tasks:
-            if task.title == title:
-                task.mark_complete()
+        for task in self._by_title.get(title, ()):
+            task.mark_complete()
 
     def mark_task_incomplete(self, title: str):
         """
@@ -92,13 +175,17 @@ class TaskManager:
         Args:
             title (str): The title of the task to be marked as incomplete.
         """
-        for task in self.tasks:
-            if task.title == title:
-                task.mark_incomplete()
+        for task in self._by_title.get(title, ()):
+            task.mark_incomplete()
 
 import argparse
 import json
 
+try:
+    import orjson  # Optional C parser, used for configuration files when installed
+except ImportError:
+    orjson = None
+
 class CommandLineInterface:
     """
     Provides a command-line interface for interacting with the task manager.
@@ -111,6 +198,13 @@ class CommandLineInterface:
             task_manager (TaskManager): An instance of TaskManager to manage tasks.
         """
         self.task_manager = task_manager
+        self._commands = {  # Maps each command name to its handler
+            "add": self._cmd_add,
+            "remove": self._cmd_remove,
+            "list": self._cmd_list,
+            "complete": self._cmd_complete,
+            "incomplete": self._cmd_incomplete,
+        }
 
     # Expansion A: Configuration File Support
     def load_config(self, config_file: str):
@@ -118,16 +212,18 @@ class CommandLineInterface:
         Loads settings from a configuration file.
         Args:
             config_file (str): The path to the configuration file (JSON format).
+                Parsed with orjson when it is installed, otherwise with the standard json module.
         """
         if not os.path.exists(config_file):
             print(f"Configuration file '{config_file}' not found.")
             return
 
-        with open(config_file, "r") as file:
-            config = json.load(file)
-            for task in config.get("tasks", []):
-                self.task_manager.add_task(task["title"], task["description"])
-            print(f"Loaded {len(config.get('tasks', []))} tasks from configuration file.")
+        with open(config_file, "rb") as file:
+            data = file.read()
+        config = orjson.loads(data) if orjson is not None else json.loads(data)
+        tasks = config.get("tasks", [])
+        self.task_manager.add_tasks({"title": task["title"], "description": task["description"]} for task in tasks)
+        print(f"Loaded {len(tasks)} tasks from configuration file.")
 
     # Expansion B: Argument Validation
     def validate_arguments(self, args):
@@ -136,9 +232,9 @@ class CommandLineInterface:
         Args:
             args (argparse.Namespace): Parsed command-line arguments.
         """
-        if args.command not in ["add", "remove", "list", "complete", "incomplete"]:
+        if args.command not in self._commands:
             print(f"Invalid command: {args.command}")
-            print("Valid commands are: add, remove, list, complete, incomplete.")
+            print(f"Valid commands are: {', '.join(self._commands)}.")
             exit(1)
 
     def execute(self, args):
@@ -148,21 +244,49 @@ class CommandLineInterface:
             args (argparse.Namespace): Parsed command-line arguments.
         """
         self.validate_arguments(args)
+        self._commands[args.command](args)
 
-        if args.command == "add":
-            self.task_manager.add_task(args.title, args.description)
-            print(f"Task '{args.title}' added successfully.")
-        elif args.command == "remove":
-            self.task_manager.remove_task(args.title)
-            print(f"Task '{args.title}' removed successfully.")
-        elif args.command == "list":
-            print("Listing all tasks:")
-            self.task_manager.list_tasks()
-        elif args.command == "complete":
-            self.task_manager.mark_task_complete(args.title)
-            print(f"Task '{args.title}' marked as complete.")
-        elif args.command == "incomplete":
-            self.task_manager.mark_task_incomplete(args.title)
-            print(f"Task '{args.title}' marked as incomplete.")
+    def _cmd_add(self, args):
+        """
+        Handles the "add" command.
+        Args:
+            args (argparse.Namespace): Parsed command-line arguments.
+        """
+        self.task_manager.add_task(args.title, args.description)
+        print(f"Task '{args.title}' added successfully.")
 
+    def _cmd_remove(self, args):
+        """
+        Handles the "remove" command.
+        Args:
+            args (argparse.Namespace): Parsed command-line arguments.
+        """
+        self.task_manager.remove_task(args.title)
+        print(f"Task '{args.title}' removed successfully.")
 
+    def _cmd_list(self, args):
+        """
+        Handles the "list" command.
+        Args:
+            args (argparse.Namespace): Parsed command-line arguments.
+        """
+        print("Listing all tasks:")
+        self.task_manager.list_tasks()
+
+    def _cmd_complete(self, args):
+        """
+        Handles the "complete" command.
+        Args:
+            args (argparse.Namespace): Parsed command-line arguments.
+        """
+        self.task_manager.mark_task_complete(args.title)
+        print(f"Task '{args.title}' marked as complete.")
+
+    def _cmd_incomplete(self, args):
+        """
+        Handles the "incomplete" command.
+        Args:
+            args (argparse.Namespace): Parsed command-line arguments.
+        """
+        self.task_manager.mark_task_incomplete(args.title)
+        print(f"Task '{args.title}' marked as incomplete.")
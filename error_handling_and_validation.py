@@ -4,10 +4,11 @@
 # update their status.
 
 import json
+import logging
 import os
+import sys
 from datetime import datetime
-
-# import logging
+from operator import attrgetter, countOf
 
 # # Set up logging
 # logging.basicConfig(
@@ -16,6 +17,19 @@ from datetime import datetime
 #     format="%(asctime)s - %(levelname)s - %(message)s"
 # )
 
+logger = logging.getLogger(__name__)
+
+def _intern(title):
+    """
+    Interns a title so that equal titles share one string object and compare on identity.
+    Args:
+        title (str): The title to intern.
+    Returns:
+        str: The interned title, or the title unchanged if it is not exactly a str
+            (sys.intern rejects str subclasses).
+    """
+    return sys.intern(title) if type(title) is str else title
+
 class Task:
     """
     Represents an individual task with a title, description, and status.
@@ -23,7 +37,14 @@ class Task:
         title (str): The title of the task.
         description (str): A brief description of the task.
         status (str): The status of the task, either "incomplete" or "complete".
+        status_code (int): The status encoded as Task.INCOMPLETE or Task.COMPLETE.
     """
+    __slots__ = ("title", "description", "status_code", "_row")
+
+    INCOMPLETE = 0
+    COMPLETE = 1
+    _STATUS_NAMES = ("incomplete", "complete")
+
     def __init__(self, title: str, description: str, status: str = "incomplete"):
         """
         Initializes a new Task instance.
@@ -32,30 +53,61 @@ class Task:
             description (str): A brief description of the task.
             status (str): The initial status of the task (default is "incomplete").
         """
-        self.title = title
+        # Interned so that title index lookups and comparisons resolve on identity
+        self.title = _intern(title)
         self.description = description
         self.status = status
 
+    @property
+    def status(self):
+        """
+        Returns the status of the task as a string, either "incomplete" or "complete".
+        """
+        return Task._STATUS_NAMES[self.status_code]
+
+    @status.setter
+    def status(self, status: str):
+        """
+        Sets the status of the task from its string form.
+        Args:
+            status (str): The new status, either "incomplete" or "complete".
+        """
+        self.status_code = Task.COMPLETE if status == "complete" else Task.INCOMPLETE
+        self._row = None
+
+    def format_row(self):
+        """
+        Returns the task formatted as a line of the task listing.
+        The line is cached until the status changes; titles and descriptions are not edited in place.
+        Returns:
+            str: The task's title, description, and status.
+        """
+        if self._row is None:
+            self._row = f"Title: {self.title}, Description: {self.description}, Status: {self.status}"
+        return self._row
+
     def mark_complete(self):
         """
         Marks the task as complete by setting its status to "complete".
         """
-        self.status = "complete"
+        self.status_code = Task.COMPLETE
+        self._row = None
 
     def mark_incomplete(self):
         """
         Marks the task as incomplete by setting its status to "incomplete".
         """
-        self.status = "incomplete"
+        self.status_code = Task.INCOMPLETE
+        self._row = None
 
-# # Custom Exceptions
-# class TaskNotFoundError(Exception):
-#     """Raised when a task is not found in the task list."""
-#     pass
+# Custom Exceptions
+class TaskNotFoundError(Exception):
+    """Raised when a task is not found in the task list."""
+    pass
 
-# class InvalidInputError(Exception):
-#     """Raised when user input is invalid."""
-#     pass
+class InvalidInputError(Exception):
+    """Raised when user input is invalid."""
+    pass
 
 class TaskManager:
     """
@@ -68,6 +120,15 @@ class TaskManager:
         Initializes a new TaskManager instance with an empty task list.
         """
         self.tasks = []
+        self._by_title = {}  # Maps each title to the tasks carrying it, in insertion order
+
+    def _index_task(self, task: Task):
+        """
+        Registers a task in the title index so lookups by title avoid scanning the task list.
+        Args:
+            task (Task): The task to register.
+        """
+        self._by_title.setdefault(task.title, []).append(task)
 
     def add_task(self, title: str, description: str):
         """
@@ -78,6 +139,7 @@ class TaskManager:
         """
         task = Task(title, description)
         self.tasks.append(task)
+        self._index_task(task)
 
     def remove_task(self, title: str):
         """
@@ -85,14 +147,27 @@ class TaskManager:
         Args:
             title (str): The title of the task to be removed.
         """
-        self.tasks = [task for task in self.tasks if task.title != title]
+        title = _intern(title)
+        removed = self._by_title.pop(title, None)
+        if removed is None:
+            return
+        if len(removed) == 1:
+            self.tasks.remove(removed[0])
+            return
+        # Several tasks share the title: compact the survivors in place, keeping their order
+        kept = 0
+        for task in self.tasks:
+            if task.title != title:
+                self.tasks[kept] = task
+                kept += 1
+        del self.tasks[kept:]
 
     def list_tasks(self):
         """
         Lists all tasks in the task list, displaying their title, description, and status.
         """
-        for task in self.tasks:
-            print(f"Title: {task.title}, Description: {task.description}, Status: {task.status}")
+        if self.tasks:
+            print("\n".join([task.format_row() for task in self.tasks]))
 
     def mark_task_complete(self, title: str):
         """
@@ -100,9 +175,9 @@ class TaskManager:
         Args:
             title (str): The title of the task to be marked as complete.
         """
-        for task in self.tasks:
-            if task.title == title:
-                task.mark_complete()
+        title = _intern(title)
+        for task in self._by_title.get(title, ()):
+            task.mark_complete()
 
     def mark_task_incomplete(self, title: str):
         """
@@ -110,9 +185,22 @@ class TaskManager:
         Args:
             title (str): The title of the task to be marked as incomplete.
         """
-        for task in self.tasks:
-            if task.title == title:
-                task.mark_incomplete()
+        title = _intern(title)
+        for task in self._by_title.get(title, ()):
+            task.mark_incomplete()
+
+    def count_tasks_by_status(self, status: str):
+        """
+        Counts the tasks with the given status.
+        Args:
+            status (str): The status to count ("complete" or "incomplete").
+        Returns:
+            int: The number of tasks with the specified status.
+        """
+        if status not in Task._STATUS_NAMES:
+            return 0
+        # Compare the integer codes in C via countOf instead of reading status strings in a Python loop
+        return countOf(map(attrgetter("status_code"), self.tasks), Task._STATUS_NAMES.index(status))
 
 
 
@@ -121,6 +209,19 @@ class TaskManagerWithValidation(TaskManager):
     """
     Extends TaskManager to include error handling, input validation, and logging.
     """
+    @staticmethod
+    def _not_found(action: str, title: str):
+        """
+        Logs a failed operation on a missing task and raises the matching error.
+        Args:
+            action (str): The operation that failed, e.g. "remove task".
+            title (str): The title that was not found.
+        Raises:
+            TaskNotFoundError: Always.
+        """
+        logger.error("Failed to %s: Task '%s' not found.", action, title)
+        raise TaskNotFoundError(f"Task with title '{title}' not found.")
+
     def add_task(self, title: str, description: str):
         """
         Adds a new task to the task list with input validation.
@@ -131,10 +232,10 @@ class TaskManagerWithValidation(TaskManager):
             InvalidInputError: If the title or description is empty.
         """
         if not title.strip() or not description.strip():
-            logging.error("Failed to add task: Title or description is empty.")
+            logger.error("Failed to add task: Title or description is empty.")
             raise InvalidInputError("Task title and description cannot be empty.")
         super().add_task(title, description)
-        logging.info(f"Task added: {title}")
+        logger.info("Task added: %s", title)
 
     def remove_task(self, title: str):
         """
@@ -144,12 +245,11 @@ class TaskManagerWithValidation(TaskManager):
         Raises:
             TaskNotFoundError: If the task with the given title does not exist.
         """
-        task_titles = [task.title for task in self.tasks]
-        if title not in task_titles:
-            logging.error(f"Failed to remove task: Task '{title}' not found.")
-            raise TaskNotFoundError(f"Task with title '{title}' not found.")
+        title = _intern(title)
+        if title not in self._by_title:
+            self._not_found("remove task", title)
         super().remove_task(title)
-        logging.info(f"Task removed: {title}")
+        logger.info("Task removed: %s", title)
 
     def mark_task_complete(self, title: str):
         """
@@ -159,12 +259,14 @@ class TaskManagerWithValidation(TaskManager):
         Raises:
             TaskNotFoundError: If the task with the given title does not exist.
         """
-        task_titles = [task.title for task in self.tasks]
-        if title not in task_titles:
-            logging.error(f"Failed to mark task as complete: Task '{title}' not found.")
-            raise TaskNotFoundError(f"Task with title '{title}' not found.")
-        super().mark_task_complete(title)
-        logging.info(f"Task marked as complete: {title}")
+        title = _intern(title)
+        tasks = self._by_title.get(title)
+        if tasks is None:
+            self._not_found("mark task as complete", title)
+        # The index lookup both validates the title and yields the tasks to update
+        for task in tasks:
+            task.mark_complete()
+        logger.info("Task marked as complete: %s", title)
 
     def mark_task_incomplete(self, title: str):
         """
@@ -174,22 +276,39 @@ class TaskManagerWithValidation(TaskManager):
         Raises:
             TaskNotFoundError: If the task with the given title does not exist.
         """
-        task_titles = [task.title for task in self.tasks]
-        if title not in task_titles:
-            logging.error(f"Failed to mark task as incomplete: Task '{title}' not found.")
-            raise TaskNotFoundError(f"Task with title '{title}' not found.")
-        super().mark_task_incomplete(title)
-        logging.info(f"Task marked as incomplete: {title}")
+        title = _intern(title)
+        tasks = self._by_title.get(title)
+        if tasks is None:
+            self._not_found("mark task as incomplete", title)
+        # The index lookup both validates the title and yields the tasks to update
+        for task in tasks:
+            task.mark_incomplete()
+        logger.info("Task marked as incomplete: %s", title)
+
+    def count_tasks_by_status(self, status: str):
+        """
+        Counts the tasks with the given status, with input validation.
+        Args:
+            status (str): The status to count ("complete" or "incomplete").
+        Returns:
+            int: The number of tasks with the specified status.
+        Raises:
+            InvalidInputError: If the status is not "complete" or "incomplete".
+        """
+        if status not in Task._STATUS_NAMES:
+            logger.error("Failed to count tasks: Invalid status '%s'.", status)
+            raise InvalidInputError(f"Invalid status '{status}'. Use 'complete' or 'incomplete'.")
+        return super().count_tasks_by_status(status)
 
     def list_tasks(self):
         """
         Lists all tasks with logging.
         """
         if not self.tasks:
-            logging.info("No tasks to list.")
+            logger.info("No tasks to list.")
             print("No tasks available.")
         else:
-            logging.info("Listing all tasks.")
+            logger.info("Listing all tasks.")
             super().list_tasks()
 
 
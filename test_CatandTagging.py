@@ -0,0 +1,75 @@
+import unittest
+from CatandTagging import TaskManagerWithCategoriesAndTags
+
+class Label(str):
+    """
+    A str subclass, which sys.intern does not accept.
+    """
+
+class TestCategoryAndTagQueries(unittest.TestCase):
+    """
+    Unit tests for the category, nested category, and tag queries of the TaskManagerWithCategoriesAndTags class.
+    """
+    def setUp(self):
+        self.manager = TaskManagerWithCategoriesAndTags()
+        self.manager.add_task("t1", "d1", category="Work/Project A", tags=["urgent"])
+        self.manager.add_task("t2", "d2", category="Home", tags=["chores"])
+        self.manager.add_task("t3", "d3", category="Work/Project A", tags=["review", "urgent"])
+        self.manager.add_task("t4", "d4", category="Work", tags=["review"])
+        self.manager.add_task("t5", "d5")
+
+    def titles(self, tasks):
+        return [task.title for task in tasks]
+
+    def test_filter_tasks_by_category(self):
+        self.assertEqual(self.titles(self.manager.filter_tasks_by_category("Work/Project A")), ["t1", "t3"])
+        self.assertEqual(self.titles(self.manager.filter_tasks_by_category("Work")), ["t4"])
+        self.assertEqual(self.titles(self.manager.filter_tasks_by_category(None)), ["t5"])
+        self.assertEqual(self.manager.filter_tasks_by_category("Missing"), [])
+
+    def test_filter_tasks_by_nested_category(self):
+        self.assertEqual(self.titles(self.manager.filter_tasks_by_nested_category(["Work", "Project A"])), ["t1", "t3"])
+        self.assertEqual(self.titles(self.manager.filter_tasks_by_nested_category(["Work"])), ["t4"])
+        self.assertEqual(self.manager.filter_tasks_by_nested_category(["Project A"]), [])
+
+    def test_search_tasks_by_tags_keeps_list_order(self):
+        self.assertEqual(self.titles(self.manager.search_tasks_by_tags(["review", "urgent"])), ["t1", "t3", "t4"])
+        self.assertEqual(self.titles(self.manager.search_tasks_by_tags(["chores", "urgent", "urgent"])), ["t1", "t2", "t3"])
+        self.assertEqual(self.manager.search_tasks_by_tags(["missing"]), [])
+
+    def test_queries_after_remove_task(self):
+        self.manager.remove_task("t3")
+        self.manager.remove_task("t4")
+        self.assertEqual(self.titles(self.manager.filter_tasks_by_category("Work/Project A")), ["t1"])
+        self.assertEqual(self.manager.filter_tasks_by_category("Work"), [])
+        self.assertEqual(self.titles(self.manager.filter_tasks_by_nested_category(["Work", "Project A"])), ["t1"])
+        self.assertEqual(self.manager.search_tasks_by_tags(["review"]), [])
+        self.assertEqual(self.titles(self.manager.search_tasks_by_tags(["urgent", "chores"])), ["t1", "t2"])
+        self.assertNotIn("Work", self.manager._by_category)
+        self.assertNotIn("review", self.manager._by_tag)
+
+    def test_queries_after_remove_and_re_add(self):
+        self.manager.remove_task("t1")
+        self.manager.add_task("t1", "d1 again", category="Work/Project A", tags=["urgent"])
+        self.assertEqual(self.titles(self.manager.search_tasks_by_tags(["urgent"])), ["t3", "t1"])
+        self.assertEqual(self.titles(self.manager.filter_tasks_by_category("Work/Project A")), ["t3", "t1"])
+
+    def test_add_tasks_indexes_rows(self):
+        self.manager.add_tasks([{"title": "t6", "description": "d6", "category": "Home", "tags": ["chores"]}])
+        self.assertEqual(self.titles(self.manager.filter_tasks_by_category("Home")), ["t2", "t6"])
+        self.assertEqual(self.titles(self.manager.search_tasks_by_tags(["chores"])), ["t2", "t6"])
+
+    def test_str_subclass_categories_and_tags(self):
+        self.manager.add_task("t6", "d6", category=Label("Work/Project A"), tags=[Label("urgent")])
+        self.assertEqual(self.titles(self.manager.filter_tasks_by_category(Label("Work/Project A"))), ["t1", "t3", "t6"])
+        self.assertEqual(self.titles(self.manager.filter_tasks_by_nested_category(["Work", "Project A"])), ["t1", "t3", "t6"])
+        self.assertEqual(self.titles(self.manager.search_tasks_by_tags([Label("urgent")])), ["t1", "t3", "t6"])
+
+    def test_non_str_categories_and_tags(self):
+        self.manager.add_task("t6", "d6", category=7, tags=[1, "urgent"])
+        self.assertEqual(self.titles(self.manager.filter_tasks_by_category(7)), ["t6"])
+        self.assertEqual(self.titles(self.manager.search_tasks_by_tags([1])), ["t6"])
+        self.assertEqual(self.manager.filter_tasks_by_nested_category(["7"]), [])
+
+if __name__ == "__main__":
+    unittest.main()
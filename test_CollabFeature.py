@@ -0,0 +1,67 @@
+import unittest
+from unittest.mock import patch
+from CollabFeature import CollaborationManager
+
+class TestSharedTasks(unittest.TestCase):
+    """
+    Unit tests for task sharing and comments in the CollaborationManager class.
+    """
+    def setUp(self):
+        patcher = patch("builtins.print")
+        self.mocked_print = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.manager = CollaborationManager()
+        self.manager.add_user("alice")
+        self.manager.add_user("bob")
+        self.owner_tasks = self.manager.users["alice"].tasks
+        self.owner_tasks.add_task("Task 1", "Description 1")
+        self.owner_task = self.owner_tasks.tasks[0]
+
+    def share(self, permission):
+        self.manager.share_task("alice", "bob", "Task 1", permission)
+        return self.manager.users["bob"].tasks
+
+    def test_read_view_denies_status_changes(self):
+        recipient_tasks = self.share("read")
+        self.mocked_print.reset_mock()
+        recipient_tasks.mark_task_complete("Task 1")
+        self.mocked_print.assert_called_once_with("Permission denied: Read-only access.")
+        self.assertEqual(self.owner_task.status, "incomplete")
+        self.assertEqual(recipient_tasks.tasks[0].status, "incomplete")
+
+    def test_edit_view_changes_owner_status(self):
+        recipient_tasks = self.share("edit")
+        recipient_tasks.mark_task_complete("Task 1")
+        self.assertEqual(self.owner_task.status, "complete")
+        recipient_tasks.mark_task_incomplete("Task 1")
+        self.assertEqual(self.owner_task.status, "incomplete")
+
+    def test_view_shows_owner_changes_live(self):
+        recipient_tasks = self.share("read")
+        self.owner_tasks.mark_task_complete("Task 1")
+        shared = recipient_tasks.tasks[0]
+        self.assertEqual((shared.title, shared.description, shared.status), ("Task 1", "Description 1", "complete"))
+        self.assertEqual(shared.status_code, self.owner_task.status_code)
+
+    def test_read_view_denies_comments(self):
+        self.manager.add_comment_to_task("alice", "Task 1", "Owner note")
+        self.share("read")
+        self.manager.add_comment_to_task("bob", "Task 1", "Recipient note")
+        shared = self.manager.users["bob"].tasks.tasks[0]
+        shared.comments = ["Overwritten"]
+        self.assertEqual(self.owner_task.comments, ["Owner note"])
+        self.assertEqual(shared.comments, ("Owner note",))
+
+    def test_edit_view_comments_reach_owner(self):
+        self.share("edit")
+        self.manager.add_comment_to_task("bob", "Task 1", "Recipient note")
+        self.manager.add_comment_to_task("alice", "Task 1", "Owner note")
+        self.assertEqual(self.owner_task.comments, ["Recipient note", "Owner note"])
+        self.assertIs(self.manager.users["bob"].tasks.tasks[0].comments, self.owner_task.comments)
+
+    def test_share_missing_task(self):
+        self.manager.share_task("alice", "bob", "Missing", "edit")
+        self.assertEqual(self.manager.users["bob"].tasks.tasks, [])
+
+if __name__ == "__main__":
+    unittest.main()
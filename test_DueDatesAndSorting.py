@@ -0,0 +1,127 @@
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import patch
+from DueDatesAndSorting import Priority, TaskManager, TaskManagerWithDueDatesAndSorting, TaskWithDueDateAndPriority
+
+class TestTaskManager(unittest.TestCase):
+    """
+    Unit tests for the TaskManager class.
+    """
+    def setUp(self):
+        self.manager = TaskManager()
+
+    def test_remove_task_with_duplicate_titles(self):
+        self.manager.add_task("Task 1", "Description 1")
+        self.manager.add_task("Task 2", "Description 2")
+        self.manager.add_task("Task 1", "Description 3")
+        self.manager.remove_task("Task 1")
+        self.assertEqual([task.title for task in self.manager.tasks], ["Task 2"])
+
+    def test_mark_task_complete(self):
+        self.manager.add_task("Task 1", "Description 1")
+        self.manager.add_task("Task 2", "Description 2")
+        self.manager.mark_task_complete("Task 1")
+        self.assertEqual(self.manager.tasks[0].status, "complete")
+        self.assertEqual(self.manager.tasks[1].status, "incomplete")
+        self.manager.mark_task_incomplete("Task 1")
+        self.assertEqual(self.manager.tasks[0].status, "incomplete")
+
+    def test_list_tasks(self):
+        self.manager.add_task("Task 1", "Description 1")
+        self.manager.add_task("Task 2", "Description 2")
+        with patch("builtins.print") as mocked_print:
+            self.manager.list_tasks()
+            mocked_print.assert_called_once_with(
+                "Title: Task 1, Description: Description 1, Status: incomplete\n"
+                "Title: Task 2, Description: Description 2, Status: incomplete"
+            )
+
+    def test_list_tasks_empty(self):
+        with patch("builtins.print") as mocked_print:
+            self.manager.list_tasks()
+            mocked_print.assert_not_called()
+
+class TestTaskWithDueDateAndPriority(unittest.TestCase):
+    """
+    Unit tests for the TaskWithDueDateAndPriority class.
+    """
+    def test_priority(self):
+        task = TaskWithDueDateAndPriority("Task 1", "Description 1", priority="HIGH")
+        self.assertIs(task.priority, Priority.HIGH)
+        self.assertEqual(str(task.priority), "high")
+        self.assertIs(TaskWithDueDateAndPriority("Task 2", "Description 2").priority, Priority.MEDIUM)
+        self.assertIs(TaskWithDueDateAndPriority("Task 3", "Description 3", priority=None).priority, Priority.MEDIUM)
+        self.assertIs(TaskWithDueDateAndPriority("Task 4", "Description 4", priority=Priority.LOW).priority, Priority.LOW)
+
+    def test_invalid_priority(self):
+        with self.assertRaises(ValueError):
+            TaskWithDueDateAndPriority("Task 1", "Description 1", priority="urgent")
+
+    def test_due_date_with_single_digit_fields(self):
+        task = TaskWithDueDateAndPriority("Task 1", "Description 1", due_date="2030-1-1")
+        self.assertEqual(task.due_date, datetime(2030, 1, 1))
+
+    def test_invalid_due_date(self):
+        for due_date in ("2030-01-01T23:00", "20300101", "2030-13-01"):
+            with self.assertRaises(ValueError):
+                TaskWithDueDateAndPriority("Task 1", "Description 1", due_date=due_date)
+
+    def test_is_due_soon(self):
+        self.assertFalse(TaskWithDueDateAndPriority("Task 1", "Description 1").is_due_soon())
+        task = TaskWithDueDateAndPriority("Task 2", "Description 2", due_date="2000-01-01")
+        self.assertTrue(task.is_due_soon())
+
+class TestTaskManagerWithDueDatesAndSorting(unittest.TestCase):
+    """
+    Unit tests for the TaskManagerWithDueDatesAndSorting class.
+    """
+    def setUp(self):
+        self.manager = TaskManagerWithDueDatesAndSorting()
+
+    def test_sort_tasks_by_status(self):
+        self.manager.add_task("Task 1", "Description 1")
+        self.manager.add_task("Task 2", "Description 2")
+        self.manager.mark_task_complete("Task 1")
+        self.manager.sort_tasks_by_status()
+        self.assertEqual([task.status for task in self.manager.tasks], ["incomplete", "complete"])
+
+    def test_list_due_soon_tasks(self):
+        soon = (datetime.now() + timedelta(days=2)).strftime("%Y-%m-%d")
+        later = (datetime.now() + timedelta(days=30)).strftime("%Y-%m-%d")
+        self.manager.add_task("Task 1", "Description 1", due_date=soon, priority="high")
+        self.manager.add_task("Task 2", "Description 2", due_date=later)
+        self.manager.add_task("Task 3", "Description 3")
+        with patch("builtins.print") as mocked_print:
+            self.manager.list_due_soon_tasks(days=5)
+            mocked_print.assert_called_once_with(f"Title: Task 1, Due Date: {soon}, Priority: high")
+
+    def test_sort_tasks_by_due_date(self):
+        self.manager.add_task("Task 1", "Description 1")
+        self.manager.add_task("Task 2", "Description 2", due_date="2030-01-02")
+        self.manager.add_task("Task 3", "Description 3", due_date="2030-01-01")
+        self.manager.sort_tasks_by_due_date()
+        self.assertEqual([task.title for task in self.manager.tasks], ["Task 3", "Task 2", "Task 1"])
+
+    def test_sort_tasks_by_priority(self):
+        self.manager.add_task("Task 1", "Description 1", priority="low")
+        self.manager.add_task("Task 2", "Description 2", priority="high")
+        self.manager.add_task("Task 3", "Description 3")
+        self.manager.sort_tasks_by_priority()
+        self.assertEqual([task.title for task in self.manager.tasks], ["Task 2", "Task 3", "Task 1"])
+
+    def test_add_task_with_no_priority(self):
+        self.manager.add_task("Task 1", "Description 1", priority=None)
+        self.manager.add_tasks([{"title": "Task 2", "description": "Description 2", "priority": None}])
+        self.assertEqual([task.priority for task in self.manager.tasks], [Priority.MEDIUM, Priority.MEDIUM])
+
+    def test_add_task_with_invalid_priority(self):
+        for priority in ("urgent", 0, 1.5):
+            with self.assertRaises(ValueError):
+                self.manager.add_task("Task 1", "Description 1", priority=priority)
+            with self.assertRaises(ValueError):
+                self.manager.add_tasks([{"title": "Task 2", "description": "Description 2"},
+                                        {"title": "Task 3", "description": "Description 3", "priority": priority}])
+        self.assertEqual(self.manager.tasks, [])
+
+if __name__ == "__main__":
+    unittest.main()
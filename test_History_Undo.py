@@ -0,0 +1,196 @@
+import unittest
+from unittest.mock import patch
+from History_Undo import TaskManagerWithHistory
+
+class HistoryTestCase(unittest.TestCase):
+    """
+    Base class for TaskManagerWithHistory tests; silences the undo and redo messages.
+    """
+    def setUp(self):
+        self.manager = TaskManagerWithHistory()
+        patcher = patch("builtins.print")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def state(self):
+        return [(task.title, task.description, task.status) for task in self.manager.tasks]
+
+    def assertIndexConsistent(self):
+        expected = {}
+        for task in self.manager.tasks:
+            expected.setdefault(task.title, []).append(task)
+        self.assertEqual(self.manager._by_title, expected)
+
+class TestUndoRedo(HistoryTestCase):
+    """
+    Unit tests for undoing and redoing each operation of the TaskManagerWithHistory class.
+    """
+    def test_add_task(self):
+        self.manager.add_task("Task 1", "Description 1")
+        self.manager.add_task("Task 2", "Description 2")
+        self.manager.undo()
+        self.assertEqual(self.state(), [("Task 1", "Description 1", "incomplete")])
+        self.assertIndexConsistent()
+        self.manager.redo()
+        self.assertEqual([title for title, _, _ in self.state()], ["Task 1", "Task 2"])
+        self.assertIndexConsistent()
+
+    def test_add_tasks_is_one_step(self):
+        self.manager.add_task("Task 0", "Description 0")
+        self.manager.add_tasks({"title": f"Task {i}", "description": f"Description {i}"} for i in range(1, 4))
+        self.manager.undo()
+        self.assertEqual([title for title, _, _ in self.state()], ["Task 0"])
+        self.manager.redo()
+        self.assertEqual([title for title, _, _ in self.state()], ["Task 0", "Task 1", "Task 2", "Task 3"])
+        self.assertIndexConsistent()
+
+    def test_remove_task_with_duplicate_titles(self):
+        self.manager.add_task("Task 1", "Description 1")
+        self.manager.add_task("Task 2", "Description 2")
+        self.manager.add_task("Task 1", "Description 3")
+        self.manager.add_task("Task 3", "Description 4")
+        before = self.state()
+        self.manager.remove_task("Task 1")
+        after = self.state()
+        self.assertEqual([title for title, _, _ in after], ["Task 2", "Task 3"])
+        self.manager.undo()
+        self.assertEqual(self.state(), before)
+        self.assertIndexConsistent()
+        self.manager.redo()
+        self.assertEqual(self.state(), after)
+        self.assertIndexConsistent()
+
+    def test_mark_task_complete_and_incomplete(self):
+        self.manager.add_task("Task 1", "Description 1")
+        self.manager.add_task("Task 1", "Description 2")
+        self.manager.mark_task_complete("Task 1")
+        self.manager.mark_task_incomplete("Task 1")
+        self.manager.undo()
+        self.assertEqual([status for _, _, status in self.state()], ["complete", "complete"])
+        self.manager.undo()
+        self.assertEqual([status for _, _, status in self.state()], ["incomplete", "incomplete"])
+        self.manager.redo()
+        self.manager.redo()
+        self.assertEqual([status for _, _, status in self.state()], ["incomplete", "incomplete"])
+        self.manager.undo()
+        self.assertEqual([status for _, _, status in self.state()], ["complete", "complete"])
+
+    def test_no_op_operations_are_not_recorded(self):
+        self.manager.remove_task("Missing")
+        self.manager.mark_task_complete("Missing")
+        self.manager.add_tasks([])
+        self.assertEqual(self.manager.history, [])
+
+    def test_undo_all_then_redo_all(self):
+        self.manager.add_task("Task 1", "Description 1")
+        self.manager.add_task("Task 2", "Description 2")
+        self.manager.mark_task_complete("Task 2")
+        self.manager.remove_task("Task 1")
+        final = self.state()
+        for _ in range(4):
+            self.manager.undo()
+        self.assertEqual(self.state(), [])
+        self.assertIndexConsistent()
+        for _ in range(4):
+            self.manager.redo()
+        self.assertEqual(self.state(), final)
+        self.assertIndexConsistent()
+
+    def test_new_operation_clears_redo(self):
+        self.manager.add_task("Task 1", "Description 1")
+        self.manager.undo()
+        self.manager.add_task("Task 2", "Description 2")
+        self.manager.redo()
+        self.assertEqual([title for title, _, _ in self.state()], ["Task 2"])
+
+    def test_save_state_restores_direct_changes(self):
+        self.manager.add_task("Task 1", "Description 1")
+        self.manager.save_state()
+        self.manager.tasks[0].mark_complete()
+        self.manager.tasks[0].description = "Edited"
+        self.manager.undo()
+        self.assertEqual(self.state(), [("Task 1", "Description 1", "incomplete")])
+        self.manager.redo()
+        self.assertEqual(self.state(), [("Task 1", "Edited", "complete")])
+        self.assertIndexConsistent()
+
+class TestTransactions(HistoryTestCase):
+    """
+    Unit tests for the transaction context of the TaskManagerWithHistory class.
+    """
+    def test_batch_is_one_undo_step(self):
+        self.manager.add_task("Task 1", "Description 1")
+        with self.manager.transaction():
+            self.manager.add_task("Task 2", "Description 2")
+            self.manager.mark_task_complete("Task 1")
+            self.manager.remove_task("Task 2")
+            self.manager.add_task("Task 3", "Description 3")
+        final = self.state()
+        self.assertEqual(len(self.manager.history), 2)
+        self.manager.undo()
+        self.assertEqual(self.state(), [("Task 1", "Description 1", "incomplete")])
+        self.assertIndexConsistent()
+        self.manager.redo()
+        self.assertEqual(self.state(), final)
+        self.assertIndexConsistent()
+
+    def test_nested_transactions_fold_into_outer(self):
+        with self.manager.transaction():
+            self.manager.add_task("Task 1", "Description 1")
+            with self.manager.transaction():
+                self.manager.add_task("Task 2", "Description 2")
+            self.assertEqual(self.manager.history, [])
+            self.manager.add_task("Task 3", "Description 3")
+        self.assertEqual(len(self.manager.history), 1)
+        self.manager.undo()
+        self.assertEqual(self.state(), [])
+
+    def test_empty_transaction_records_nothing(self):
+        self.manager.add_task("Task 1", "Description 1")
+        self.manager.undo()
+        with self.manager.transaction():
+            self.manager.remove_task("Missing")
+        self.assertEqual(self.manager.history, [])
+        self.assertEqual(len(self.manager.redo_stack), 1)
+
+    def test_single_record_transaction_is_not_wrapped(self):
+        with self.manager.transaction():
+            self.manager.add_task("Task 1", "Description 1")
+        self.assertEqual(self.manager.history[0][0], "add")
+
+    def test_transaction_records_on_exception(self):
+        with self.assertRaises(ValueError):
+            with self.manager.transaction():
+                self.manager.add_task("Task 1", "Description 1")
+                raise ValueError
+        self.assertEqual(len(self.manager.history), 1)
+        self.manager.undo()
+        self.assertEqual(self.state(), [])
+        self.assertEqual(self.manager._tx_depth, 0)
+
+    def test_undo_and_redo_refused_inside_transaction(self):
+        self.manager.add_task("Task 1", "Description 1")
+        with self.manager.transaction():
+            self.manager.add_task("Task 2", "Description 2")
+            self.manager.undo()
+            self.manager.redo()
+            self.assertEqual([title for title, _, _ in self.state()], ["Task 1", "Task 2"])
+        self.assertIndexConsistent()
+        self.manager.undo()
+        self.assertEqual([title for title, _, _ in self.state()], ["Task 1"])
+        self.manager.undo()
+        self.assertEqual(self.state(), [])
+        self.assertIndexConsistent()
+
+    def test_undo_add_removes_recorded_tasks(self):
+        self.manager.add_task("Task 1", "Description 1")
+        self.manager.add_task("Task 2", "Description 2")
+        self.manager.save_state()
+        self.manager.tasks.reverse()
+        self.manager.history.pop()  # Drop the checkpoint so the next undo reverts the add of Task 2
+        self.manager.undo()
+        self.assertEqual([title for title, _, _ in self.state()], ["Task 1"])
+        self.assertIndexConsistent()
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+import importlib.util
+import os
+import unittest
+
+# advance-querying.py has a hyphen in its name, so it is loaded by path rather than imported
+_spec = importlib.util.spec_from_file_location(
+    "advance_querying", os.path.join(os.path.dirname(os.path.abspath(__file__)), "advance-querying.py")
+)
+advance_querying = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(advance_querying)
+AdvancedTaskManager = advance_querying.AdvancedTaskManager
+
+class TestStatusQueries(unittest.TestCase):
+    """
+    Unit tests for the status filters of the AdvancedTaskManager class.
+    """
+    def setUp(self):
+        self.manager = AdvancedTaskManager()
+        self.manager.add_task("Task 1", "Description 1")
+        self.manager.add_task("Task 2", "Description 2")
+        self.manager.add_task("Task 3", "Description 3")
+
+    def test_filter_tasks_by_status(self):
+        self.manager.mark_task_complete("Task 3")
+        self.manager.mark_task_complete("Task 1")
+        self.assertEqual([task.title for task in self.manager.filter_tasks_by_status("complete")], ["Task 1", "Task 3"])
+        self.assertEqual([task.title for task in self.manager.filter_tasks_by_status("incomplete")], ["Task 2"])
+        self.assertEqual(self.manager.filter_tasks_by_status("unknown"), [])
+
+    def test_count_tasks_by_status(self):
+        self.manager.mark_task_complete("Task 2")
+        self.assertEqual(self.manager.count_tasks_by_status("complete"), 1)
+        self.assertEqual(self.manager.count_tasks_by_status("incomplete"), 2)
+        self.assertEqual(self.manager.count_tasks_by_status("unknown"), 0)
+
+    def test_status_queries_see_direct_task_changes(self):
+        self.manager.mark_task_complete("Task 1")
+        self.manager.tasks[1].mark_complete()
+        self.manager.tasks[0].status = "incomplete"
+        self.manager.search_tasks_by_keyword("Task 3")[0].mark_complete()
+        self.assertEqual([task.title for task in self.manager.filter_tasks_by_status("complete")], ["Task 2", "Task 3"])
+        self.assertEqual(self.manager.count_tasks_by_status("complete"), 2)
+        self.assertEqual([task.title for task in self.manager.filter_tasks(status="complete", keywords=["2"])], ["Task 2"])
+
+    def test_status_queries_after_remove(self):
+        self.manager.mark_task_complete("Task 2")
+        self.manager.remove_task("Task 2")
+        self.assertEqual(self.manager.filter_tasks_by_status("complete"), [])
+        self.assertEqual(self.manager.count_tasks_by_status("incomplete"), 2)
+
+class TestKeywordSearch(unittest.TestCase):
+    """
+    Unit tests for the keyword searches and the search cache of the AdvancedTaskManager class.
+    """
+    def setUp(self):
+        self.manager = AdvancedTaskManager()
+        self.manager.add_task("Buy groceries", "Milk and bread from the grocery store")
+        self.manager.add_task("Write report", "Quarterly to-do list review")
+        self.manager.add_task("Call Bob", "About the garage")
+
+    def titles(self, tasks):
+        return [task.title for task in tasks]
+
+    def test_substring_search(self):
+        self.assertEqual(self.titles(self.manager.search_tasks_by_keyword("GRO")), ["Buy groceries"])
+        self.assertEqual(self.titles(self.manager.search_tasks_by_keywords(["gro", "bob"])), ["Buy groceries", "Call Bob"])
+        self.assertEqual(self.manager.search_tasks_by_keywords([]), [])
+
+    def test_whole_word_search(self):
+        self.assertEqual(self.manager.search_tasks_by_keyword("gro", whole_words=True), [])
+        self.assertEqual(self.titles(self.manager.search_tasks_by_keyword("Grocery", whole_words=True)), ["Buy groceries"])
+        self.assertEqual(self.titles(self.manager.search_tasks_by_keywords(["bob", "milk"], whole_words=True)), ["Buy groceries", "Call Bob"])
+
+    def test_whole_word_search_falls_back_to_substrings(self):
+        # "to-do" is not a single word, so it is matched as a substring
+        self.assertEqual(self.titles(self.manager.search_tasks_by_keywords(["to-do"], whole_words=True)), ["Write report"])
+        self.assertEqual(self.titles(self.manager.search_tasks_by_keywords(["bob", "to-do"], whole_words=True)), ["Write report", "Call Bob"])
+
+    def test_keywords_with_regex_characters(self):
+        self.manager.add_task("Price", "Costs $5 (approx.)")
+        self.assertEqual(self.titles(self.manager.search_tasks_by_keywords(["(approx.)", "$5"])), ["Price"])
+        self.assertEqual(self.manager.search_tasks_by_keywords([".*"]), [])
+
+    def test_cache_invalidated_by_add(self):
+        self.assertEqual(self.titles(self.manager.search_tasks_by_keyword("report")), ["Write report"])
+        self.manager.add_task("Send report", "To the team")
+        self.assertEqual(self.titles(self.manager.search_tasks_by_keyword("report")), ["Write report", "Send report"])
+        self.assertEqual(self.titles(self.manager.search_tasks_by_keywords(["report"], whole_words=True)), ["Write report", "Send report"])
+
+    def test_cache_invalidated_by_remove(self):
+        self.assertEqual(len(self.manager.search_tasks_by_keywords(["gro", "bob"])), 2)
+        self.manager.remove_task("Call Bob")
+        self.assertEqual(self.titles(self.manager.search_tasks_by_keywords(["gro", "bob"])), ["Buy groceries"])
+        self.assertEqual(self.manager.search_tasks_by_keyword("bob", whole_words=True), [])
+
+    def test_returned_list_can_be_mutated(self):
+        results = self.manager.search_tasks_by_keyword("gro")
+        results.clear()
+        self.assertEqual(self.titles(self.manager.search_tasks_by_keyword("gro")), ["Buy groceries"])
+        results = self.manager.search_tasks_by_keywords(["bob"], whole_words=True)
+        results.append(None)
+        self.assertEqual(self.titles(self.manager.search_tasks_by_keywords(["bob"], whole_words=True)), ["Call Bob"])
+
+    def test_cache_is_bounded(self):
+        for i in range(AdvancedTaskManager.SEARCH_CACHE_SIZE + 10):
+            self.manager.search_tasks_by_keyword(f"keyword {i}")
+        self.assertEqual(len(self.manager._search_cache), AdvancedTaskManager.SEARCH_CACHE_SIZE)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,35 @@
+import unittest
+from command_line_options import TaskManager
+
+class TestTaskManager(unittest.TestCase):
+    """
+    Unit tests for the bulk loading of the TaskManager class.
+    """
+    def setUp(self):
+        self.manager = TaskManager()
+
+    def test_add_tasks(self):
+        self.manager.add_tasks([
+            {"title": "Task 1", "description": "Description 1"},
+            {"title": "Task 2", "description": "Description 2", "status": "complete"},
+        ])
+        self.assertEqual([(task.title, task.description, task.status) for task in self.manager.tasks],
+                         [("Task 1", "Description 1", "incomplete"), ("Task 2", "Description 2", "complete")])
+        self.manager.mark_task_complete("Task 1")
+        self.assertEqual(self.manager.tasks[0].status, "complete")
+
+    def test_add_tasks_rejects_unknown_fields(self):
+        with self.assertRaises(TypeError):
+            self.manager.add_tasks([
+                {"title": "Task 1", "description": "Description 1"},
+                {"title": "Task 2", "description": "Description 2", "stauts": "complete"},
+            ])
+        self.assertEqual(self.manager.tasks, [])
+
+    def test_add_tasks_rejects_missing_fields(self):
+        with self.assertRaises(TypeError):
+            self.manager.add_tasks([{"title": "Task 1"}])
+        self.assertEqual(self.manager.tasks, [])
+
+if __name__ == "__main__":
+    unittest.main()
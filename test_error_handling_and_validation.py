@@ -0,0 +1,72 @@
+import logging
+import unittest
+from error_handling_and_validation import InvalidInputError, TaskManager, TaskManagerWithValidation, TaskNotFoundError
+
+class TitleSubclass(str):
+    """
+    A str subclass, which sys.intern does not accept.
+    """
+
+class TestTaskManagerWithValidation(unittest.TestCase):
+    """
+    Unit tests for the TaskManagerWithValidation class.
+    """
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        self.addCleanup(logging.disable, logging.NOTSET)
+        self.manager = TaskManagerWithValidation()
+
+    def test_titles_are_interned(self):
+        self.manager.add_task("".join(["Task", " 1"]), "Description 1")
+        self.manager.add_task("".join(["Task", " 1"]), "Description 2")
+        self.assertIs(self.manager.tasks[0].title, self.manager.tasks[1].title)
+        self.assertIs(next(iter(self.manager._by_title)), self.manager.tasks[0].title)
+
+    def test_lookups_with_equal_titles(self):
+        self.manager.add_task("Task 1", "Description 1")
+        self.manager.add_task("Task 2", "Description 2")
+        self.manager.add_task("Task 1", "Description 3")
+        self.manager.mark_task_complete("".join(["Task", " 1"]))
+        self.assertEqual([task.status for task in self.manager.tasks], ["complete", "incomplete", "complete"])
+        self.manager.remove_task("".join(["Task", " 1"]))
+        self.assertEqual([task.title for task in self.manager.tasks], ["Task 2"])
+
+    def test_str_subclass_titles(self):
+        self.manager.add_task(TitleSubclass("Task 1"), "Description 1")
+        self.manager.add_task("Task 1", "Description 2")
+        self.manager.mark_task_complete(TitleSubclass("Task 1"))
+        self.manager.mark_task_incomplete(TitleSubclass("Task 1"))
+        self.manager.remove_task(TitleSubclass("Task 1"))
+        self.assertEqual(self.manager.tasks, [])
+
+    def test_count_tasks_by_status(self):
+        for i in range(5):
+            self.manager.add_task(f"Task {i}", f"Description {i}")
+        self.manager.mark_task_complete("Task 1")
+        self.manager.tasks[3].mark_complete()
+        self.assertEqual(self.manager.count_tasks_by_status("complete"), 2)
+        self.assertEqual(self.manager.count_tasks_by_status("incomplete"), 3)
+        with self.assertRaises(InvalidInputError):
+            self.manager.count_tasks_by_status("done")
+
+    def test_missing_title_raises(self):
+        for operation in (self.manager.remove_task, self.manager.mark_task_complete, self.manager.mark_task_incomplete):
+            with self.assertRaises(TaskNotFoundError):
+                operation("Missing")
+
+class TestTaskManager(unittest.TestCase):
+    """
+    Unit tests for the TaskManager class.
+    """
+    def test_count_tasks_by_status(self):
+        manager = TaskManager()
+        self.assertEqual(manager.count_tasks_by_status("complete"), 0)
+        manager.add_task("Task 1", "Description 1")
+        manager.add_task("Task 2", "Description 2")
+        manager.mark_task_complete("Task 2")
+        self.assertEqual(manager.count_tasks_by_status("complete"), 1)
+        self.assertEqual(manager.count_tasks_by_status("incomplete"), 1)
+        self.assertEqual(manager.count_tasks_by_status("done"), 0)
+
+if __name__ == "__main__":
+    unittest.main()